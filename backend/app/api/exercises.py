@@ -3,8 +3,10 @@
 import json
 import os
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Response
@@ -67,6 +69,11 @@ USE_SUPABASE = True  # os.getenv("USE_SUPABASE", "false").lower() == "true"
 # Chemin vers le fichier JSON des exercices (fallback)
 EXERCISES_FILE = Path(__file__).parent.parent / "models" / "exercises.json"
 
+# Durée de vie (secondes) du cache mémoire des exercices chargés
+EXERCISES_CACHE_TTL = int(os.getenv("EXERCISES_CACHE_TTL", "600"))
+_exercises_cache: Dict[str, Any] = {"loaded_at": 0.0, "data": None}
+_exercises_cache_lock = threading.Lock()
+
 
 @lru_cache()
 def get_supabase_client() -> Optional[Client]:
@@ -125,8 +132,6 @@ def load_exercises_from_supabase() -> List[Exercise]:
     Raises:
         HTTPException: Si erreur de connexion ou de récupération
     """
-    import time
-
     try:
         total_start = time.time()
         logger.info("=== DIAGNOSTIC PERFORMANCE SUPABASE ===")
@@ -200,17 +205,51 @@ def load_exercises_from_supabase() -> List[Exercise]:
         )
 
 
+def get_cached_exercises() -> List[Exercise]:
+    """
+    Retourne la liste partagée du cache mémoire des exercices.
+
+    La même instance est renvoyée tant que le TTL n'a pas expiré : elle sert
+    de jeton de version aux caches dérivés. Elle ne doit pas être modifiée.
+
+    Returns:
+        List[Exercise]: Liste des exercices (partagée, lecture seule)
+    """
+    cached = _exercises_cache["data"]
+    if cached is not None and (
+        time.monotonic() - _exercises_cache["loaded_at"] < EXERCISES_CACHE_TTL
+    ):
+        return cached
+
+    with _exercises_cache_lock:
+        # Un autre thread a pu recharger pendant l'attente du verrou
+        cached = _exercises_cache["data"]
+        if cached is None or (
+            time.monotonic() - _exercises_cache["loaded_at"] >= EXERCISES_CACHE_TTL
+        ):
+            if USE_SUPABASE:
+                cached = load_exercises_from_supabase()
+            else:
+                cached = load_exercises_from_json()
+            _exercises_cache["data"] = cached
+            _exercises_cache["loaded_at"] = time.monotonic()
+
+    return cached
+
+
 def load_exercises() -> List[Exercise]:
     """
     Charge les exercices depuis Supabase ou JSON selon la configuration.
 
+    Le résultat est gardé en mémoire EXERCISES_CACHE_TTL secondes : un seul
+    aller-retour Supabase par période au lieu d'un par requête. Un verrou
+    évite que plusieurs requêtes rechargent en même temps à l'expiration.
+
     Returns:
         List[Exercise]: Liste des exercices
     """
-    if USE_SUPABASE:
-        return load_exercises_from_supabase()
-    else:
-        return load_exercises_from_json()
+    # Copie de la liste: les appelants peuvent la filtrer ou la trier
+    return list(get_cached_exercises())
 
 
 @router.get("/exercises", response_model=List[Exercise])
@@ -2,8 +2,6 @@
 
 import asyncio
 import logging
-import tempfile
-from pathlib import Path
 from typing import List
 from uuid import uuid4
 
@@ -181,14 +179,14 @@ generated_workouts = {}
 
 
 async def stream_ffmpeg_output(
-    command: List[str], concat_file: Path, timeout: int = GENERATION_TIMEOUT
+    command: List[str], concat_manifest: str, timeout: int = GENERATION_TIMEOUT
 ):
     """
     Stream la sortie d'une commande FFmpeg de manière asynchrone.
 
     Args:
         command: Commande FFmpeg à exécuter
-        concat_file: Chemin du fichier de concaténation temporaire à nettoyer après succès
+        concat_manifest: Liste concat transmise à FFmpeg sur stdin (pipe:0)
         timeout: Timeout en secondes
 
     Yields:
@@ -205,10 +203,17 @@ async def stream_ffmpeg_output(
         # Lancer le processus FFmpeg
         process = await asyncio.create_subprocess_exec(
             *command,
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
 
+        # Le demuxer concat lit toute la liste à l'ouverture: on l'envoie puis
+        # on ferme stdin (pas de fichier temporaire à créer ni à nettoyer)
+        process.stdin.write(concat_manifest.encode())
+        await process.stdin.drain()
+        process.stdin.close()
+
         # Streamer la sortie par chunks
         chunk_size = 64 * 1024  # 64KB chunks
         while True:
@@ -248,14 +253,6 @@ async def stream_ffmpeg_output(
 
         logger.info("Génération vidéo terminée avec succès")
 
-        # Nettoyage du fichier de concaténation temporaire après succès
-        try:
-            if concat_file and concat_file.exists():
-                concat_file.unlink()
-                logger.debug(f"Fichier temporaire nettoyé après succès: {concat_file}")
-        except Exception as e:
-            logger.warning(f"Impossible de nettoyer le fichier temporaire: {e}")
-
     except HTTPException:
         raise
     except Exception as e:
@@ -350,12 +347,6 @@ async def generate_workout_video(request: GenerateVideoRequest):
         speed = video_service.get_speed_multiplier(request.config.intensity)
         logger.debug(f"Multiplicateur de vitesse: {speed}x")
 
-        # Préparer les chemins des vidéos et créer le fichier de concat
-        temp_dir = Path(tempfile.gettempdir())
-        import os
-
-        concat_file = temp_dir / f"concat_{os.getpid()}.txt"
-
         # Utiliser le téléchargement parallèle optimisé au lieu de la boucle séquentielle
         video_map = video_service._download_videos_parallel(selected_exercises)
 
@@ -372,13 +363,10 @@ async def generate_workout_video(request: GenerateVideoRequest):
                     detail=f"Fichier vidéo manquant pour l'exercice '{exercise.name}'",
                 )
 
-        # Créer le fichier de concaténation
-        with open(concat_file, "w") as f:
-            for video_path in video_paths:
-                f.write(f"file '{video_path.absolute()}'\n")
-
-        logger.debug(f"Fichier de concaténation créé: {concat_file}")
-        logger.info(f"Fichier de concaténation existe: {concat_file.exists()}")
+        # Liste de concaténation, envoyée à FFmpeg sur stdin
+        concat_manifest = "".join(
+            f"file '{video_path.absolute()}'\n" for video_path in video_paths
+        )
 
         # Construire la commande FFmpeg pour streaming vers stdout
         command = [
@@ -387,8 +375,10 @@ async def generate_workout_video(request: GenerateVideoRequest):
             "concat",
             "-safe",
             "0",
+            "-protocol_whitelist",
+            "file,pipe",
             "-i",
-            str(concat_file),
+            "pipe:0",
         ]
 
         # Ajout du filtre de vitesse si nécessaire
@@ -418,7 +408,7 @@ async def generate_workout_video(request: GenerateVideoRequest):
 
         # 6. Retourner la réponse en streaming
         return StreamingResponse(
-            stream_ffmpeg_output(command, concat_file, timeout=GENERATION_TIMEOUT),
+            stream_ffmpeg_output(command, concat_manifest, timeout=GENERATION_TIMEOUT),
             media_type="video/mp4",
             headers={
                 "Accept-Ranges": "bytes",  # Support des Range Requests pour streaming progressif
@@ -554,12 +544,6 @@ async def generate_auto_workout_video(request: GenerateWorkoutVideoRequest):
         speed = video_service.get_speed_multiplier(request.config.intensity)
         logger.debug(f"Multiplicateur de vitesse: {speed}x")
 
-        # Créer le fichier de concaténation temporaire
-        temp_dir = Path(tempfile.gettempdir())
-        import os
-
-        concat_file = temp_dir / f"concat_{os.getpid()}.txt"
-
         # Vérifier et préparer les chemins vidéo
         # Utiliser le téléchargement parallèle optimisé au lieu de la boucle séquentielle
         video_map = video_service._download_videos_parallel(selected_exercises)
@@ -577,12 +561,10 @@ async def generate_auto_workout_video(request: GenerateWorkoutVideoRequest):
                     detail=f"Fichier vidéo manquant pour l'exercice '{exercise.name}'",
                 )
 
-        # Créer le fichier de concaténation
-        with open(concat_file, "w") as f:
-            for video_path in video_paths:
-                f.write(f"file '{video_path.absolute()}'\n")
-
-        logger.debug(f"Fichier de concaténation créé: {concat_file}")
+        # Liste de concaténation, envoyée à FFmpeg sur stdin
+        concat_manifest = "".join(
+            f"file '{video_path.absolute()}'\n" for video_path in video_paths
+        )
 
         # 6. Construire la commande FFmpeg pour streaming vers stdout
         command = [
@@ -591,8 +573,10 @@ async def generate_auto_workout_video(request: GenerateWorkoutVideoRequest):
             "concat",
             "-safe",
             "0",
+            "-protocol_whitelist",
+            "file,pipe",
             "-i",
-            str(concat_file),
+            "pipe:0",
         ]
 
         # Ajout du filtre de vitesse si nécessaire
@@ -646,7 +630,7 @@ async def generate_auto_workout_video(request: GenerateWorkoutVideoRequest):
 
         # 8. Retourner la réponse en streaming
         return StreamingResponse(
-            stream_ffmpeg_output(command, concat_file, timeout=GENERATION_TIMEOUT),
+            stream_ffmpeg_output(command, concat_manifest, timeout=GENERATION_TIMEOUT),
             media_type="video/mp4",
             headers={
                 "Content-Disposition": f'inline; filename="{request.name.replace(" ", "_")}.mp4"',
@@ -871,7 +855,7 @@ async def stream_workout_progressive(workout_data):
     logger.info("Démarrage du streaming progressif")
 
     # Construire la commande FFmpeg optimisée
-    command = build_optimized_ffmpeg_command(workout_data)
+    command, concat_manifest = build_optimized_ffmpeg_command(workout_data)
     logger.debug(f"Commande FFmpeg: {' '.join(command)}")
 
     # OPTIMISATION 2: Buffer réduit pour démarrer le streaming plus vite
@@ -884,10 +868,17 @@ async def stream_workout_progressive(workout_data):
 
         process = await asyncio.create_subprocess_exec(
             *command,
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
 
+        # Le demuxer concat lit toute la liste à l'ouverture: on l'envoie puis
+        # on ferme stdin (pas de fichier temporaire à créer ni à nettoyer)
+        process.stdin.write(concat_manifest.encode())
+        await process.stdin.drain()
+        process.stdin.close()
+
         logger.info("Processus FFmpeg démarré, buffering des premières données...")
 
         # Lire stderr en arrière-plan pour capturer les erreurs
@@ -1064,10 +1055,10 @@ def build_optimized_ffmpeg_command(workout_data):
     """
     Construit une commande FFmpeg optimisée pour le streaming progressif.
     Utilise OptimizedVideoService pour la construction de la commande.
+
+    Returns:
+        Tuple (commande FFmpeg, liste concat à envoyer sur stdin)
     """
-    import tempfile
-    import os
-    from pathlib import Path
 
     logger.info("🔧 DÉBUT build_optimized_ffmpeg_command")
 
@@ -1083,10 +1074,6 @@ def build_optimized_ffmpeg_command(workout_data):
     # Utiliser l'instance globale du service vidéo optimisé (évite réinitialisation)
     video_service = get_video_service()
 
-    # Préparer les chemins des vidéos et créer le fichier de concat
-    temp_dir = Path(tempfile.gettempdir())
-    concat_file = temp_dir / f"concat_{os.getpid()}.txt"
-
     # Utiliser le téléchargement parallèle optimisé au lieu de la boucle séquentielle
     logger.info(
         f"🚀 AVANT APPEL _download_videos_parallel avec {len(exercises)} exercices"
@@ -1109,12 +1096,10 @@ def build_optimized_ffmpeg_command(workout_data):
                 detail=f"Fichier vidéo manquant pour l'exercice '{exercise.name}'",
             )
 
-    # Créer le fichier de concaténation
-    with open(concat_file, "w") as f:
-        for video_path in video_paths:
-            f.write(f"file '{video_path.absolute()}'\n")
-
-    logger.debug(f"Fichier de concaténation créé: {concat_file}")
+    # Liste de concaténation, envoyée à FFmpeg sur stdin
+    concat_manifest = "".join(
+        f"file '{video_path.absolute()}'\n" for video_path in video_paths
+    )
 
     # Construire la commande FFmpeg pour streaming vers stdout
     speed = video_service.get_speed_multiplier(config.intensity)
@@ -1125,8 +1110,10 @@ def build_optimized_ffmpeg_command(workout_data):
         "concat",
         "-safe",
         "0",
+        "-protocol_whitelist",
+        "file,pipe",
         "-i",
-        str(concat_file),
+        "pipe:0",
     ]
 
     # Ajout du filtre de vitesse si nécessaire
@@ -1152,7 +1139,7 @@ def build_optimized_ffmpeg_command(workout_data):
         ]
     )
 
-    return command
+    return command, concat_manifest
 
 
 def estimate_video_size(workout_data) -> int:
@@ -3,20 +3,264 @@ Service de traitement vidéo - Classe de base
 Fournit les utilitaires de base pour la manipulation de vidéos
 """
 
+import fcntl
+import json
 import logging
+import os
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Set, Tuple
 import hashlib
 import requests
 import shutil
 
+try:
+    import av
+
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+try:
+    from diskcache import Cache
+
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+from ..models.config import WorkoutConfig
 from ..models.exercise import Exercise
 from ..models.enums import Intensity
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
 
+# Taille demandée pour les pipes vers/depuis FFmpeg (64 Ko par défaut sous Linux)
+PIPE_BUFFER_SIZE = 1 << 20
+
+# Priorité des processus FFmpeg: moins prioritaires que l'API (event loop)
+FFMPEG_NICENESS = 5
+
+# Taille max de la fin de stderr FFmpeg conservée dans les logs d'erreur
+STDERR_TAIL_CHARS = 4096
+
+# Encodeur H.264 retenu par binaire ffmpeg (détecté une seule fois par process)
+_ffmpeg_encoder_cache: Dict[str, str] = {}
+
+# Cache disque partagé entre workers (probes ffprobe, encodeur détecté)
+PROBE_CACHE_DIR = os.getenv("PROBE_CACHE_DIR", "/tmp/vac_probe_cache")
+PROBE_CACHE_SIZE_LIMIT = 256 << 20  # 256 Mo
+
+
+@lru_cache(maxsize=1)
+def _get_disk_cache() -> Optional["Cache"]:
+    """
+    Ouvre le cache disque partagé entre processus (diskcache)
+
+    Avec plusieurs workers (gunicorn/uvicorn --workers N), chaque process
+    réutilise les probes et la détection d'encodeur déjà faits par les autres.
+
+    Returns:
+        Optional[Cache]: Cache disque, ou None si diskcache est absent ou si
+            le dossier n'est pas utilisable
+    """
+    if not DISKCACHE_AVAILABLE:
+        return None
+    try:
+        return Cache(PROBE_CACHE_DIR, size_limit=PROBE_CACHE_SIZE_LIMIT)
+    except Exception as e:
+        logger.warning(f"Cache disque des probes indisponible: {e}")
+        return None
+
+
+def _probe_with_pyav(path_str: str, size: int) -> Dict:
+    """
+    Lit les métadonnées d'une vidéo directement via libavformat (PyAV)
+
+    Évite le lancement d'un processus ffprobe. Le dict retourné a la même
+    forme que la sortie JSON de ffprobe (-show_entries de _probe_cached).
+
+    Args:
+        path_str: Chemin de la vidéo
+        size: Taille du fichier en octets
+
+    Returns:
+        Dict: Métadonnées au format ffprobe ("streams" et "format")
+    """
+    with av.open(path_str) as container:
+        streams = []
+        for stream in container.streams:
+            info = {"codec_name": stream.codec_context.name}
+            if stream.type == "video":
+                info["width"] = stream.codec_context.width
+                info["height"] = stream.codec_context.height
+                if stream.average_rate:
+                    info["avg_frame_rate"] = str(stream.average_rate)
+            if stream.duration is not None and stream.time_base:
+                info["duration"] = f"{float(stream.duration * stream.time_base):.6f}"
+            streams.append(info)
+
+        format_info = {"size": str(size)}
+        if container.duration is not None:
+            format_info["duration"] = f"{container.duration / av.time_base:.6f}"
+        if container.bit_rate:
+            format_info["bit_rate"] = str(container.bit_rate)
+
+    return {"streams": streams, "format": format_info}
+
+
+def _deprioritize_process(pid: int, cpu_set: Optional[Set[int]] = None) -> None:
+    """
+    Abaisse la priorité d'un processus FFmpeg et le restreint à des coeurs
+
+    Appliqué après le lancement (et non via preexec_fn) pour conserver le
+    chemin rapide posix_spawn. Contrepartie: les threads créés par FFmpeg
+    avant cet appel, quelques ms après le démarrage, n'en héritent pas.
+
+    Args:
+        pid: PID du processus FFmpeg
+        cpu_set: Coeurs autorisés (None: pas de restriction)
+    """
+    try:
+        os.setpriority(os.PRIO_PROCESS, pid, FFMPEG_NICENESS)
+        if cpu_set and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(pid, cpu_set)
+    except OSError as e:
+        # Processus déjà terminé ou plateforme sans support
+        logger.debug(f"Impossible d'ajuster la priorité de {pid}: {e}")
+
+
+def _split_cpus(slots: int) -> List[Set[int]]:
+    """
+    Découpe les coeurs disponibles en groupes disjoints
+
+    Args:
+        slots: Nombre de groupes (un par rendu simultané)
+
+    Returns:
+        List[Set[int]]: Groupes de coeurs, vide si le découpage est impossible
+            (plateforme sans sched_getaffinity ou moins de coeurs que de groupes)
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return []
+    cpus = sorted(os.sched_getaffinity(0))
+    if slots < 2 or len(cpus) < slots:
+        return []
+    return [set(cpus[i::slots]) for i in range(slots)]
+
+
+@lru_cache(maxsize=None)
+def _resolve_binary(name: str) -> str:
+    """
+    Résout le chemin absolu d'un binaire une seule fois par process
+
+    Un chemin absolu évite la recherche dans le PATH à chaque lancement et
+    permet à subprocess d'utiliser posix_spawn (vfork) plutôt que fork().
+
+    Args:
+        name: Nom du binaire (ex: "ffprobe")
+
+    Returns:
+        str: Chemin absolu, ou le nom tel quel si introuvable dans le PATH
+    """
+    return shutil.which(name) or name
+
+
+@lru_cache(maxsize=1024)
+def _probe_cached(path_str: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Exécute ffprobe sur une vidéo, avec mémoïsation du résultat
+
+    mtime_ns et size ne servent qu'à construire la clé de cache : un fichier
+    modifié produit une nouvelle clé et déclenche donc un nouveau probe. Le
+    cache en mémoire est doublé d'un cache disque partagé entre processus
+    lorsque diskcache est installé.
+
+    Args:
+        path_str: Chemin de la vidéo
+        mtime_ns: Date de modification du fichier (ns)
+        size: Taille du fichier en octets
+
+    Returns:
+        Dict: Sortie JSON de ffprobe (à ne pas modifier, partagée par le cache)
+    """
+    disk_cache = _get_disk_cache()
+    disk_key = ("probe", path_str, mtime_ns, size)
+    if disk_cache is not None:
+        info = disk_cache.get(disk_key)
+        if info is not None:
+            return info
+
+    info = _probe_uncached(path_str, size)
+    if disk_cache is not None:
+        disk_cache.set(disk_key, info)
+    return info
+
+
+def _probe_uncached(path_str: str, size: int) -> Dict:
+    """
+    Lit les métadonnées d'une vidéo (PyAV si disponible, sinon ffprobe)
+
+    Si PyAV est installé, les métadonnées sont lues en process sans lancer
+    ffprobe ; ffprobe reste utilisé en repli.
+
+    Args:
+        path_str: Chemin de la vidéo
+        size: Taille du fichier en octets
+
+    Returns:
+        Dict: Sortie JSON de ffprobe (ou équivalent construit via PyAV)
+    """
+    if PYAV_AVAILABLE:
+        try:
+            return _probe_with_pyav(path_str, size)
+        except Exception as e:
+            logger.debug(f"PyAV n'a pas pu lire {path_str}, repli sur ffprobe: {e}")
+
+    command = [
+        _resolve_binary("ffprobe"),
+        "-v",
+        "quiet",
+        "-print_format",
+        "json",
+        # Uniquement les champs utiles : JSON bien plus court que -show_streams
+        "-show_entries",
+        "stream=codec_name,width,height,duration,avg_frame_rate"
+        ":format=duration,bit_rate,size",
+        path_str,
+    ]
+
+    result = subprocess.run(command, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffprobe rc={result.returncode}: {result.stderr[-STDERR_TAIL_CHARS:]}"
+        )
+
+    return json.loads(result.stdout)
+
+
+def _enlarge_pipe(pipe) -> None:
+    """
+    Agrandit le buffer noyau d'un pipe (Linux uniquement)
+
+    Limite les blocages de FFmpeg lorsqu'il écrit plus vite que le parent
+    ne lit. Sans effet sur les plateformes sans F_SETPIPE_SZ.
+
+    Args:
+        pipe: Objet fichier du pipe (process.stdin/stdout/stderr)
+    """
+    if pipe is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+    except OSError as e:
+        # Plafonné par /proc/sys/fs/pipe-max-size pour les non-root
+        logger.debug(f"Impossible d'agrandir le pipe: {e}")
+
 
 class VideoService:
     """Service de base pour la manipulation de vidéos d'entraînement"""
@@ -28,6 +272,31 @@ class VideoService:
         Intensity.HIGH_INTENSITY: 1.2,  # 120% vitesse normale (plus rapide)
     }
 
+    # Encodeurs H.264 matériels par ordre de préférence (libx264 en fallback CPU)
+    # input_args: options avant -i, filter: filtre ajouté en fin de chaîne -vf
+    HW_ENCODERS = {
+        "h264_nvenc": {
+            "input_args": [],
+            "filter": None,
+            "output_args": ["-preset", "p1", "-rc", "vbr", "-cq", "23"],
+        },
+        "h264_videotoolbox": {
+            "input_args": [],
+            "filter": None,
+            "output_args": ["-b:v", "6M", "-realtime", "1"],
+        },
+        "h264_qsv": {
+            "input_args": [],
+            "filter": None,
+            "output_args": ["-preset", "veryfast", "-global_quality", "23"],
+        },
+        "h264_vaapi": {
+            "input_args": ["-vaapi_device", "/dev/dri/renderD128"],
+            "filter": "format=nv12,hwupload",
+            "output_args": ["-qp", "23"],
+        },
+    }
+
     def __init__(
         self,
         project_root: Path,
@@ -58,6 +327,29 @@ class VideoService:
         # Créer le dossier de cache s'il n'existe pas
         self.video_cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Binaires résolus une fois: chemins absolus réutilisés à chaque appel
+        self.ffmpeg_path = shutil.which("ffmpeg")
+        self.ffprobe_path = shutil.which("ffprobe")
+
+        # Image de fond des breaks, recherchée une seule fois
+        self.sport_room_image = self._find_sport_room_image()
+
+        # Encodeur vidéo (matériel si disponible, sinon libx264)
+        self.video_encoder = self._detect_hw_encoder()
+
+        # Processus FFmpeg en cours, par fichier de sortie (pour annulation)
+        self._active_processes: Dict[Path, subprocess.Popen] = {}
+        self._processes_lock = threading.Lock()
+
+        # Sérialise la génération des breaks partagés entre rendus parallèles
+        self._break_lock = threading.Lock()
+
+        # Avancement des rendus en cours (0.0 à 1.0), par fichier de sortie
+        self._progress: Dict[Path, float] = {}
+
+        # Groupes de coeurs libres pendant un generate_videos (vide sinon)
+        self._free_cpu_slots: List[Set[int]] = []
+
         logger.info(
             f"VideoService initialisé avec project_root: {self.project_root}, "
             f"base_path: {self.base_video_path}, cache_dir: {self.video_cache_dir}"
@@ -77,6 +369,115 @@ class VideoService:
         logger.debug(f"Multiplicateur de vitesse pour {intensity}: {multiplier}")
         return multiplier
 
+    def _find_sport_room_image(self) -> Optional[Path]:
+        """
+        Recherche l'image sport_room.png utilisée pour les vidéos de break
+
+        Returns:
+            Optional[Path]: Chemin de l'image ou None si introuvable
+        """
+        possible_paths = [
+            Path("/app/sport_room.png"),  # Railway: racine app
+            Path("/app/backend/sport_room.png"),  # Railway: dossier backend
+            self.project_root / "sport_room.png",  # Chemin normal
+            self.project_root / "backend" / "sport_room.png",  # Backend subfolder
+            Path(__file__).parent.parent.parent.parent
+            / "sport_room.png",  # Remontée explicite
+        ]
+
+        for path in possible_paths:
+            if path.exists():
+                return path
+
+        logger.warning(
+            f"Image sport_room.png introuvable dans: {[str(p) for p in possible_paths]}"
+        )
+        return None
+
+    def _detect_hw_encoder(self) -> str:
+        """
+        Détecte le meilleur encodeur H.264 disponible
+
+        Liste les encodeurs compilés dans FFmpeg puis vérifie chaque candidat
+        matériel par un encodage de test (l'encodeur peut être compilé sans
+        que le GPU soit présent). Le résultat est mis en cache par binaire.
+
+        Returns:
+            str: Nom de l'encodeur FFmpeg (ex: "h264_nvenc" ou "libx264")
+        """
+        ffmpeg_path = self.ffmpeg_path
+        if not ffmpeg_path:
+            return "libx264"
+
+        if ffmpeg_path in _ffmpeg_encoder_cache:
+            return _ffmpeg_encoder_cache[ffmpeg_path]
+
+        disk_cache = _get_disk_cache()
+        disk_key = ("encoder", ffmpeg_path)
+        if disk_cache is not None:
+            encoder = disk_cache.get(disk_key)
+            if encoder is not None:
+                _ffmpeg_encoder_cache[ffmpeg_path] = encoder
+                return encoder
+
+        encoder = "libx264"
+        try:
+            result = subprocess.run(
+                [ffmpeg_path, "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=10,
+            )
+            for name, settings in self.HW_ENCODERS.items():
+                if f" {name} " in result.stdout and self._encoder_works(
+                    ffmpeg_path, name, settings
+                ):
+                    encoder = name
+                    break
+        except Exception as e:
+            logger.warning(f"Détection des encodeurs matériels impossible: {e}")
+
+        _ffmpeg_encoder_cache[ffmpeg_path] = encoder
+        if disk_cache is not None:
+            # Expire pour suivre un changement de matériel ou de drivers
+            disk_cache.set(disk_key, encoder, expire=24 * 3600)
+        logger.info(f"Encodeur vidéo sélectionné: {encoder}")
+        return encoder
+
+    def _encoder_works(self, ffmpeg_path: str, encoder: str, settings: Dict) -> bool:
+        """
+        Vérifie qu'un encodeur matériel fonctionne avec un encodage de test
+
+        Args:
+            ffmpeg_path: Chemin du binaire FFmpeg
+            encoder: Nom de l'encodeur à tester
+            settings: Options de l'encodeur (voir HW_ENCODERS)
+
+        Returns:
+            bool: True si l'encodage de test réussit
+        """
+        command = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            *settings["input_args"],
+            "-f",
+            "lavfi",
+            "-i",
+            "color=black:size=256x256:duration=0.1",
+        ]
+        if settings["filter"]:
+            command.extend(["-vf", settings["filter"]])
+        command.extend(["-c:v", encoder, "-f", "null", "-"])
+
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=10)
+            return result.returncode == 0
+        except Exception:
+            return False
+
     def _trim_video(self, input_path: Path, output_path: Path, duration: int) -> bool:
         """
         Trimme une vidéo à une durée spécifique.
@@ -90,7 +491,7 @@ class VideoService:
             bool: True si succès, False sinon
         """
         try:
-            ffmpeg_path = shutil.which("ffmpeg")
+            ffmpeg_path = self.ffmpeg_path
             if not ffmpeg_path:
                 logger.error("FFmpeg introuvable")
                 return False
@@ -147,31 +548,15 @@ class VideoService:
         logger.info(f"=== GÉNÉRATION BREAK {duration}s ===")
 
         # Recherche FFmpeg
-        ffmpeg_path = shutil.which("ffmpeg")
+        ffmpeg_path = self.ffmpeg_path
         if not ffmpeg_path:
             logger.error("FFmpeg introuvable dans le PATH")
             return False
 
-        # Recherche image sport_room.png
-        possible_paths = [
-            Path("/app/sport_room.png"),  # Railway: racine app
-            Path("/app/backend/sport_room.png"),  # Railway: dossier backend
-            self.project_root / "sport_room.png",  # Chemin normal
-            self.project_root / "backend" / "sport_room.png",  # Backend subfolder
-            Path(__file__).parent.parent.parent.parent
-            / "sport_room.png",  # Remontée explicite
-        ]
-
-        sport_room_image = None
-        for path in possible_paths:
-            if path.exists():
-                sport_room_image = path
-                break
-
+        # Image sport_room.png (recherchée une fois à l'initialisation)
+        sport_room_image = self.sport_room_image
         if sport_room_image is None:
-            logger.error(
-                f"Image sport_room.png introuvable dans: {[str(p) for p in possible_paths]}"
-            )
+            logger.error("Image sport_room.png introuvable")
             return False
 
         command = [
@@ -248,10 +633,11 @@ class VideoService:
 
             # Si déjà en cache, retourner directement
             if cache_file.exists():
-                cache_size = cache_file.stat().st_size
-                cache_time = (time.time() - download_start) * 1000
-                logger.info(
-                    f"⏱️ Vidéo CACHE HIT: {exercise_name} ({cache_size/1024:.1f}KB) en {cache_time:.0f}ms"
+                # Chemin chaud: log différé (pas de formatage si DEBUG filtré)
+                logger.debug(
+                    "⏱️ Vidéo CACHE HIT: %s en %.0fms",
+                    exercise_name,
+                    (time.time() - download_start) * 1000,
                 )
                 return cache_file
 
@@ -272,7 +658,7 @@ class VideoService:
                         bytes_downloaded += len(chunk)
 
             download_time = (time.time() - download_start) * 1000
-            file_size_mb = cache_file.stat().st_size / (1024 * 1024)
+            file_size_mb = bytes_downloaded / (1024 * 1024)
             speed_mbps = (
                 (file_size_mb / (download_time / 1000)) if download_time > 0 else 0
             )
@@ -351,33 +737,360 @@ class VideoService:
         )
         return None
 
-    def get_video_info(self, video_path: Path) -> Dict:
+    def _get_break_video(self, duration: int) -> Optional[Path]:
         """
-        Obtient les informations d'une vidéo avec ffprobe
+        Retourne le break de `duration` secondes, généré une seule fois
+
+        Le break est partagé par tous les rendus : il est encodé sous verrou
+        dans un fichier temporaire puis renommé, pour qu'un rendu parallèle
+        ne lise jamais un fichier partiel et qu'un échec ne soit pas mis en
+        cache.
 
         Args:
-            video_path: Chemin de la vidéo
+            duration: Durée du break en secondes
 
         Returns:
-            Dict: Informations de la vidéo (durée, résolution, codec, etc.)
+            Chemin du break ou None si erreur
         """
-        try:
-            command = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-print_format",
-                "json",
-                "-show_format",
-                "-show_streams",
-                str(video_path),
+        break_path = self.video_cache_dir / f"break_{duration}s.mp4"
+        with self._break_lock:
+            if break_path.exists():
+                return break_path
+
+            tmp_path = break_path.with_name(
+                f"{break_path.stem}.{threading.get_ident()}.tmp.mp4"
+            )
+            if not self.generate_break_video(duration, tmp_path):
+                tmp_path.unlink(missing_ok=True)
+                return None
+            os.replace(tmp_path, break_path)
+        return break_path
+
+    def build_ffmpeg_command(
+        self,
+        exercises: List[Exercise],
+        config: WorkoutConfig,
+        output_path: Path,
+    ) -> Optional[Tuple[List[str], str]]:
+        """
+        Construit une commande FFmpeg unique pour toute la séance
+
+        Les vidéos d'exercices et les breaks sont listés dans un manifeste lu
+        par le demuxer concat : un seul processus FFmpeg lit chaque source une
+        fois et encode la sortie, au lieu d'un processus par exercice. Chaque
+        exercice est limité à work_time via la directive outpoint.
+
+        Le manifeste n'est pas écrit sur disque : il est à envoyer sur l'entrée
+        standard de FFmpeg (-i pipe:0).
+
+        Args:
+            exercises: Liste ordonnée des exercices
+            config: Configuration de l'entraînement (intervals, intensité)
+            output_path: Chemin du fichier de sortie
+
+        Returns:
+            Optional[Tuple[List[str], str]]: (commande FFmpeg, manifeste concat)
+                ou None si une vidéo est manquante
+        """
+        ffmpeg_path = self.ffmpeg_path
+        if not ffmpeg_path:
+            logger.error("FFmpeg introuvable dans le PATH")
+            return None
+
+        work_time = config.intervals.get("work_time", 40)
+        rest_time = config.intervals.get("rest_time", 20)
+
+        # Un seul break généré par durée, référencé entre chaque exercice
+        break_path = None
+        if len(exercises) > 1 and rest_time > 0:
+            break_path = self._get_break_video(rest_time)
+            if break_path is None:
+                return None
+
+        concat_lines = []
+        for idx, exercise in enumerate(exercises):
+            video_path = self._resolve_video_path(exercise)
+            if video_path is None:
+                logger.error(f"Vidéo manquante pour {exercise.name}")
+                return None
+
+            concat_lines.append(f"file '{video_path.absolute()}'")
+            concat_lines.append(f"outpoint {work_time}")
+
+            if break_path is not None and idx < len(exercises) - 1:
+                concat_lines.append(f"file '{break_path.absolute()}'")
+
+        concat_manifest = "\n".join(concat_lines) + "\n"
+
+        video_filters = ["scale=1920:1080"]
+        speed = self.get_speed_multiplier(config.intensity)
+        if speed != 1.0:
+            video_filters.append(f"setpts={1.0 / speed}*PTS")
+
+        hw_settings = self.HW_ENCODERS.get(self.video_encoder)
+        if hw_settings is None:
+            encoder_args = [
+                "-c:v",
+                "libx264",
+                "-preset",
+                "ultrafast",
+                "-tune",
+                "zerolatency",  # Pas de lookahead, implique sliced-threads
+                "-threads",
+                "0",  # Autant de threads que de coeurs
+                "-crf",
+                "23",
+                "-pix_fmt",
+                "yuv420p",
             ]
+            input_args = []
+        else:
+            encoder_args = ["-c:v", self.video_encoder, *hw_settings["output_args"]]
+            if hw_settings["filter"]:
+                # Les frames sont envoyées sur le GPU: pas de -pix_fmt côté CPU
+                video_filters.append(hw_settings["filter"])
+            else:
+                encoder_args.extend(["-pix_fmt", "yuv420p"])
+            input_args = hw_settings["input_args"]
+
+        command = [
+            ffmpeg_path,
+            "-hide_banner",
+            "-loglevel",
+            "error",  # stderr: avancement et erreurs, sans l'info par entrée
+            *input_args,
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-protocol_whitelist",
+            "file,pipe",  # Manifeste sur stdin, vidéos sur disque
+            "-i",
+            "pipe:0",
+            "-vf",
+            ",".join(video_filters),
+            *encoder_args,
+            "-r",
+            "30",
+            "-an",  # Pas d'audio
+            "-progress",
+            "pipe:2",  # Avancement en lignes clé=valeur sur stderr
+            "-nostats",  # Sans les stats par défaut, coûteuses à parser
+            "-y",
+            str(output_path),
+        ]
+        return command, concat_manifest
+
+    def generate_workout_video(
+        self,
+        exercises: List[Exercise],
+        config: WorkoutConfig,
+        output_path: Path,
+    ) -> bool:
+        """
+        Génère la vidéo d'entraînement complète en un seul appel FFmpeg
+
+        Args:
+            exercises: Liste ordonnée des exercices
+            config: Configuration de l'entraînement
+            output_path: Chemin du fichier de sortie
+
+        Returns:
+            bool: True si succès, False sinon
+        """
+        import time
+
+        total_start = time.time()
+        logger.info(f"=== GÉNÉRATION VIDÉO ({len(exercises)} exercices) ===")
+
+        built = self.build_ffmpeg_command(exercises, config, output_path)
+        if not built:
+            return False
+        command, concat_manifest = built
+
+        # Durée attendue de la vidéo, pour convertir out_time_us en fraction
+        work_time = config.intervals.get("work_time", 40)
+        rest_time = config.intervals.get("rest_time", 20)
+        expected_us = (
+            work_time * len(exercises) + rest_time * max(len(exercises) - 1, 0)
+        ) * 1_000_000
+
+        try:
+            logger.debug(f"Commande FFmpeg: {' '.join(command)}")
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=PIPE_BUFFER_SIZE,
+            )
+            _enlarge_pipe(process.stdin)
+            _enlarge_pipe(process.stderr)
+            with self._processes_lock:
+                self._active_processes[output_path] = process
+                self._progress[output_path] = 0.0
+                cpu_slot = self._free_cpu_slots.pop() if self._free_cpu_slots else None
+            _deprioritize_process(process.pid, cpu_slot)
+            try:
+                # Le manifeste concat est écrit sur stdin, puis stdin est fermé
+                try:
+                    process.stdin.write(concat_manifest)
+                    process.stdin.close()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # FFmpeg arrêté tôt: la cause est sur stderr
+
+                # stderr mêle avancement (-progress) et erreurs: on ne garde
+                # que les dernières lignes pour le log en cas d'échec
+                stderr_tail = deque(maxlen=64)
+                for line in process.stderr:
+                    if line.startswith("out_time_us="):
+                        out_time_us = line[12:].strip()
+                        if out_time_us.isdigit() and expected_us > 0:
+                            self._progress[output_path] = min(
+                                int(out_time_us) / expected_us, 1.0
+                            )
+                    else:
+                        stderr_tail.append(line)
+                process.wait()
+            finally:
+                with self._processes_lock:
+                    self._active_processes.pop(output_path, None)
+                    self._progress.pop(output_path, None)
+                    if cpu_slot is not None:
+                        self._free_cpu_slots.append(cpu_slot)
+
+            if process.returncode != 0:
+                stderr = "".join(stderr_tail)
+                logger.error(
+                    f"Erreur génération vidéo (rc={process.returncode}): "
+                    f"{stderr[-STDERR_TAIL_CHARS:]}"
+                )
+                return False
+
+            # Un seul stat() : existence et taille du fichier de sortie
+            try:
+                file_size = os.stat(output_path).st_size
+            except FileNotFoundError:
+                logger.error(f"Fichier de sortie introuvable: {output_path}")
+                return False
+
+            total_time = (time.time() - total_start) * 1000
+            logger.info(
+                f"✓ Vidéo générée en {total_time:.0f}ms "
+                f"({file_size / (1024 * 1024):.2f}MB)"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Erreur inattendue génération vidéo: {e}")
+            return False
 
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
+    def _default_max_parallel(self) -> int:
+        """
+        Nombre de rendus FFmpeg simultanés adapté à l'encodeur
+
+        libx264 est déjà multi-threadé : au-delà de la moitié des coeurs les
+        processus se disputent le CPU. Les GPU grand public limitent NVENC à
+        2 sessions d'encodage simultanées.
+
+        Returns:
+            int: Nombre maximal de processus FFmpeg en parallèle
+        """
+        cpu_count = os.cpu_count() or 1
+        if self.video_encoder == "libx264":
+            return max(1, cpu_count // 2)
+        if self.video_encoder == "h264_nvenc":
+            return 2
+        return cpu_count
+
+    def generate_videos(
+        self,
+        jobs: List[Tuple[List[Exercise], WorkoutConfig, Path]],
+        max_parallel: Optional[int] = None,
+    ) -> List[bool]:
+        """
+        Génère plusieurs vidéos d'entraînement en parallèle
 
-            import json
+        Chaque job est rendu par son propre processus FFmpeg, supervisé depuis
+        un pool de threads. Chaque processus est restreint à un groupe de
+        coeurs distinct des autres rendus simultanés. Les rendus en cours
+        peuvent être interrompus via cancel_video_generation().
 
-            info = json.loads(result.stdout)
+        Args:
+            jobs: Liste de tuples (exercices, configuration, fichier de sortie)
+            max_parallel: Nombre maximal de rendus simultanés
+                (par défaut: selon l'encodeur, voir _default_max_parallel)
+
+        Returns:
+            List[bool]: Succès de chaque job, dans l'ordre des jobs
+        """
+        if not jobs:
+            return []
+
+        if max_parallel is None:
+            max_parallel = self._default_max_parallel()
+        workers = max(1, min(len(jobs), max_parallel))
+        logger.info(f"Génération de {len(jobs)} vidéos ({workers} en parallèle)")
+
+        with self._processes_lock:
+            self._free_cpu_slots = _split_cpus(workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(
+                    executor.map(lambda job: self.generate_workout_video(*job), jobs)
+                )
+        finally:
+            with self._processes_lock:
+                self._free_cpu_slots = []
+
+    def get_progress(self, output_path: Path) -> Optional[float]:
+        """
+        Donne l'avancement d'un rendu en cours
+
+        Args:
+            output_path: Fichier de sortie du rendu
+
+        Returns:
+            Optional[float]: Fraction encodée (0.0 à 1.0), None si aucun rendu
+                n'est en cours pour ce fichier
+        """
+        return self._progress.get(output_path)
+
+    def cancel_video_generation(self) -> int:
+        """
+        Interrompt tous les rendus FFmpeg en cours
+
+        Returns:
+            int: Nombre de processus interrompus
+        """
+        with self._processes_lock:
+            processes = list(self._active_processes.values())
+
+        for process in processes:
+            process.terminate()
+
+        logger.info(f"{len(processes)} rendu(s) FFmpeg interrompu(s)")
+        return len(processes)
+
+    def get_video_info(self, video_path: Path) -> Dict:
+        """
+        Obtient les informations d'une vidéo avec ffprobe
+
+        Le résultat est mis en cache tant que le fichier n'est pas modifié
+        (clé: chemin, mtime, taille).
+
+        Args:
+            video_path: Chemin de la vidéo
+
+        Returns:
+            Dict: Informations de la vidéo ("streams": codec_name, width, height,
+                duration, avg_frame_rate ; "format": duration, bit_rate, size)
+        """
+        try:
+            # Un seul stat() : mtime + taille servent de clé au cache des probes
+            st = video_path.stat()
+            info = _probe_cached(str(video_path), st.st_mtime_ns, st.st_size)
             logger.debug(f"Informations vidéo pour {video_path}: {info}")
             return info
 
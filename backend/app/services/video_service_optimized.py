@@ -3,13 +3,13 @@ Service de traitement vidéo optimisé avec concaténation progressive
 Implémente la Phase 2 du plan d'optimisation vidéo
 
 Optimisations principales:
-- Concaténation progressive par chunks (au lieu de tout d'un coup)
+- Concaténation en une seule passe FFmpeg (demuxer concat, sans intermédiaires)
 - Stream copy intelligent (détection du format source)
 - Cache des breaks pré-générés par durée
-- Nettoyage progressif des fichiers temporaires
 - Téléchargement parallèle des vidéos Supabase
 """
 
+import hashlib
 import logging
 import subprocess
 import json
@@ -17,14 +17,16 @@ import tempfile
 import os
 import shutil
 import time
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+from dataclasses import asdict, dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..models.exercise import Exercise
 from ..models.config import WorkoutConfig
-from .video_service import VideoService
+from . import video_service
+from .video_service import STDERR_TAIL_CHARS, VideoService
 
 # Configuration du logger
 logger = logging.getLogger(__name__)
@@ -39,15 +41,17 @@ class VideoFormat:
     height: int
     fps: float
     bitrate: Optional[int] = None
+    pix_fmt: Optional[str] = None  # None: inconnu (anciennes entrées du cache)
 
     @property
     def is_target_format(self) -> bool:
-        """Vérifie si la vidéo est déjà au format cible (720p H.264)"""
+        """Vérifie si la vidéo est déjà au format cible (720p H.264 yuv420p)"""
         return (
             self.codec.lower() in ("h264", "libx264", "avc1")
             and self.width == 1280
             and self.height == 720
             and abs(self.fps - 30.0) < 1.0  # Tolérance de 1 fps
+            and self.pix_fmt in (None, "yuv420p")
         )
 
 
@@ -62,6 +66,9 @@ class OptimizedVideoService(VideoService):
     - Nettoyage progressif de la mémoire
     """
 
+    # Threads FFmpeg par normalisation (normalisations parallèles x threads ≈ coeurs)
+    NORMALIZE_THREADS = 2
+
     # Format cible pour la normalisation
     TARGET_FORMAT = {
         "width": 1280,
@@ -92,12 +99,92 @@ class OptimizedVideoService(VideoService):
 
         self.max_parallel_downloads = max_parallel_downloads
 
+        # Cache des formats détectés, clé (chemin, mtime_ns, taille), persisté
+        # sur disque pour survivre aux redémarrages
+        self.format_cache_file = self.video_cache_dir / ".format_cache.json"
+        self._format_cache: Dict[Tuple[str, int, int], VideoFormat] = {}
+        self._format_cache_lock = threading.Lock()
+        self._load_format_cache()
+
+        # Copies des vidéos d'exercices normalisées au format cible (une fois)
+        self.normalized_dir = self.video_cache_dir / "normalized"
+        self.normalized_dir.mkdir(parents=True, exist_ok=True)
+
+        # Sérialise l'encodage de la seconde de break partagée
+        self._break_unit_lock = threading.Lock()
+
         logger.info(
             f"OptimizedVideoService initialisé avec "
             f"max_parallel_downloads={max_parallel_downloads}"
         )
         logger.info("✅ Les vidéos de break seront téléchargées depuis Supabase")
 
+    def _target_encode_args(
+        self, tune: str = "zerolatency"
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Options FFmpeg pour encoder au format cible avec l'encodeur détecté
+
+        Utilise l'encodeur matériel retenu par VideoService (NVENC, QSV...)
+        et, avec NVENC, le décodage NVDEC (-hwaccel cuda). Les frames décodées
+        repassent en mémoire système pour que le filtre scale reste utilisable.
+
+        Args:
+            tune: Option -tune de x264 (ignorée pour les encodeurs matériels)
+
+        Returns:
+            Tuple[List[str], List[str], List[str]]: (options avant -i,
+                filtres à ajouter après scale, options d'encodage)
+        """
+        hw_settings = self.HW_ENCODERS.get(self.video_encoder)
+        if hw_settings is None:
+            return (
+                [],
+                [],
+                [
+                    "-c:v",
+                    self.TARGET_FORMAT["codec"],  # libx264
+                    "-preset",
+                    self.TARGET_FORMAT["preset"],  # ultrafast
+                    "-crf",
+                    str(self.TARGET_FORMAT["crf"]),
+                    "-tune",
+                    tune,
+                    "-pix_fmt",
+                    "yuv420p",
+                ],
+            )
+
+        input_args = list(hw_settings["input_args"])
+        if self.video_encoder == "h264_nvenc":
+            input_args.extend(["-hwaccel", "cuda"])
+
+        filters = [hw_settings["filter"]] if hw_settings["filter"] else []
+        encoder_args = ["-c:v", self.video_encoder, *hw_settings["output_args"]]
+        if not hw_settings["filter"]:
+            encoder_args.extend(["-pix_fmt", "yuv420p"])
+        return input_args, filters, encoder_args
+
+    def _encode_signature(self) -> str:
+        """
+        Empreinte des réglages d'encodage (TARGET_FORMAT et encodeur)
+
+        Utilisée dans les noms des fichiers mis en cache : modifier
+        TARGET_FORMAT ou changer d'encodeur force leur régénération.
+
+        Returns:
+            Empreinte hexadécimale courte
+        """
+        settings = json.dumps(
+            {"target_format": self.TARGET_FORMAT, "encoder": self.video_encoder},
+            sort_keys=True,
+        )
+        return hashlib.sha1(settings.encode()).hexdigest()[:12]
+
+    def _break_unit_name(self) -> str:
+        """Nom du fichier de la seconde de break pour les réglages courants"""
+        return f"break_unit_{self.video_encoder}_{self._encode_signature()}.mp4"
+
     def _get_or_create_break(self, duration: int, temp_dir: Path) -> Optional[Path]:
         """
         Obtient une vidéo de break depuis Supabase (téléchargement avec cache)
@@ -140,6 +227,8 @@ class OptimizedVideoService(VideoService):
 
         Override de la méthode parente pour générer les breaks à la même
         résolution que les vidéos d'exercices (1280x720) au lieu de 1920x1080.
+        Seule une seconde de break est encodée (une fois, voir
+        _get_break_unit) ; elle est ensuite répétée en stream copy.
 
         Args:
             duration: Durée de la pause en secondes
@@ -150,53 +239,27 @@ class OptimizedVideoService(VideoService):
         """
         total_start = time.time()
 
-        ffmpeg_path = shutil.which("ffmpeg")
+        ffmpeg_path = self.ffmpeg_path
         if not ffmpeg_path:
             logger.error("FFmpeg introuvable dans le PATH")
             return False
 
-        # Rechercher l'image sport_room.png
-        possible_paths = [
-            Path("/app/sport_room.png"),  # Railway: racine app
-            Path("/app/backend/sport_room.png"),  # Railway: dossier backend
-            self.project_root / "sport_room.png",  # Chemin normal
-            self.project_root / "backend" / "sport_room.png",  # Backend subfolder
-            Path(__file__).parent.parent.parent.parent
-            / "sport_room.png",  # Remontée explicite
-        ]
-
-        sport_room_image = None
-        for path in possible_paths:
-            if path.exists():
-                sport_room_image = path
-                break
-
-        if sport_room_image is None:
-            logger.error(
-                f"Image sport_room.png introuvable dans: {[str(p) for p in possible_paths]}"
-            )
+        unit_path = self._get_break_unit()
+        if unit_path is None:
             return False
 
-        # Générer le break à la résolution cible (720p) pour correspondre aux exercices
+        # Répète la seconde encodée (chaque boucle commence par une image clé)
         command = [
             ffmpeg_path,
-            "-loop",
-            "1",  # Boucler l'image
+            "-stream_loop",
+            str(duration - 1),
             "-i",
-            str(sport_room_image),  # Image source
+            str(unit_path),
+            "-c",
+            "copy",
             "-t",
-            str(duration),  # Durée en secondes
-            "-vf",
-            f"scale={self.TARGET_FORMAT['width']}:{self.TARGET_FORMAT['height']}",  # 1280x720
-            "-c:v",
-            self.TARGET_FORMAT["codec"],  # libx264
-            "-preset",
-            self.TARGET_FORMAT["preset"],  # ultrafast
-            "-r",
-            str(self.TARGET_FORMAT["fps"]),  # 30 fps
-            "-pix_fmt",
-            "yuv420p",
-            "-an",  # Pas d'audio
+            str(duration),
+            "-an",
             "-y",
             str(output_path),
         ]
@@ -219,9 +282,301 @@ class OptimizedVideoService(VideoService):
             logger.error(f"Erreur inattendue génération break: {e}")
             return False
 
+    def _get_break_unit(self) -> Optional[Path]:
+        """
+        Retourne une seconde de break au format cible, encodée une seule fois
+
+        Le fichier dépend de l'encodeur et de TARGET_FORMAT (voir
+        _encode_signature) pour rester compatible avec le stream copy des
+        autres vidéos ; il est écrit dans un fichier temporaire puis renommé
+        pour ne jamais laisser d'unité partielle en cache.
+
+        Returns:
+            Chemin de la seconde de break ou None si erreur
+        """
+        # Image sport_room.png (recherchée une fois à l'initialisation)
+        sport_room_image = self.sport_room_image
+        if sport_room_image is None:
+            logger.error("Image sport_room.png introuvable")
+            return None
+
+        unit_path = self.video_cache_dir / self._break_unit_name()
+        with self._break_unit_lock:
+            if unit_path.exists():
+                return unit_path
+
+            tmp_path = unit_path.with_name(
+                f"{unit_path.stem}.{threading.get_ident()}.tmp.mp4"
+            )
+            if not self._encode_break_unit(sport_room_image, tmp_path):
+                tmp_path.unlink(missing_ok=True)
+                return None
+            os.replace(tmp_path, unit_path)
+            logger.info(f"Seconde de break encodée et mise en cache: {unit_path.name}")
+        return unit_path
+
+    def _encode_break_unit(self, image_path: Path, output_path: Path) -> bool:
+        """
+        Encode une seconde de break (fps frames, une seule image clé)
+
+        Args:
+            image_path: Image de fond (sport_room.png)
+            output_path: Chemin du fichier de sortie
+
+        Returns:
+            True si succès, False sinon
+        """
+        if video_service.PYAV_AVAILABLE:
+            try:
+                self._generate_break_pyav(image_path, 1, output_path)
+                return True
+            except Exception as e:
+                logger.warning(f"Génération break via PyAV impossible: {e}")
+
+        # Image fixe: tune stillimage, une image clé par seconde pour le seek
+        input_args, hw_filters, encoder_args = self._target_encode_args(
+            tune="stillimage"
+        )
+        command = [
+            self.ffmpeg_path,
+            *input_args,
+            "-loop",
+            "1",  # Boucler l'image
+            "-i",
+            str(image_path),  # Image source
+            "-t",
+            "1",  # Une seconde, répétée ensuite en stream copy
+            "-vf",
+            ",".join(
+                [
+                    f"scale={self.TARGET_FORMAT['width']}:{self.TARGET_FORMAT['height']}",  # 1280x720
+                    *hw_filters,
+                ]
+            ),
+            *encoder_args,
+            "-g",
+            str(self.TARGET_FORMAT["fps"]),
+            "-threads",
+            "0",  # Autant de threads que de coeurs
+            "-r",
+            str(self.TARGET_FORMAT["fps"]),  # 30 fps
+            "-an",  # Pas d'audio
+            "-y",
+            str(output_path),
+        ]
+
+        try:
+            subprocess.run(command, check=True, capture_output=True, text=True)
+            return output_path.exists()
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Erreur génération break: {e.stderr}")
+            return False
+
+    def _detect_format_pyav(self, video_path: Path) -> Optional[VideoFormat]:
+        """
+        Analyse le format d'une vidéo en process via PyAV (libavformat)
+
+        Args:
+            video_path: Chemin de la vidéo à analyser
+
+        Returns:
+            VideoFormat avec les informations ou None si aucun flux vidéo
+        """
+        with video_service.av.open(str(video_path)) as container:
+            if not container.streams.video:
+                logger.warning(f"Aucun flux vidéo trouvé dans {video_path}")
+                return None
+
+            stream = container.streams.video[0]
+            return VideoFormat(
+                codec=stream.codec_context.name,
+                width=stream.codec_context.width,
+                height=stream.codec_context.height,
+                fps=float(stream.average_rate) if stream.average_rate else 30.0,
+                bitrate=stream.bit_rate or None,
+                pix_fmt=stream.codec_context.pix_fmt,
+            )
+
+    def _load_format_cache(self) -> None:
+        """Charge le cache des formats depuis le disque (ignoré si illisible)"""
+        try:
+            with open(self.format_cache_file) as f:
+                entries = json.load(f)
+            for entry in entries:
+                key = (entry["path"], entry["mtime_ns"], entry["size"])
+                self._format_cache[key] = VideoFormat(**entry["format"])
+            logger.debug(f"{len(self._format_cache)} formats vidéo chargés du cache")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Cache des formats illisible, ignoré: {e}")
+
+    def _save_format_cache(self) -> None:
+        """
+        Écrit le cache des formats sur disque (remplacement atomique)
+
+        Seule la copie des entrées se fait sous verrou : l'écriture ne bloque
+        pas les analyses en cours. Le fichier temporaire est unique (mkstemp),
+        y compris entre plusieurs workers uvicorn.
+        """
+        with self._format_cache_lock:
+            entries = [
+                {
+                    "path": path,
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "format": asdict(fmt),
+                }
+                for (path, mtime_ns, size), fmt in self._format_cache.items()
+            ]
+        tmp_file = None
+        try:
+            fd, tmp_file = tempfile.mkstemp(
+                dir=self.format_cache_file.parent,
+                prefix=f"{self.format_cache_file.name}.",
+                suffix=".tmp",
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_file, self.format_cache_file)
+        except OSError as e:
+            logger.warning(f"Impossible d'écrire le cache des formats: {e}")
+            if tmp_file is not None:
+                Path(tmp_file).unlink(missing_ok=True)
+
+    def _generate_break_pyav(
+        self, image_path: Path, duration: int, output_path: Path
+    ) -> None:
+        """
+        Encode la vidéo de break en process via PyAV, sans lancer FFmpeg
+
+        L'image est décodée et convertie en yuv420p une seule fois, puis la
+        même frame est encodée duration x fps fois.
+
+        Args:
+            image_path: Image de fond (sport_room.png)
+            duration: Durée de la pause en secondes
+            output_path: Chemin du fichier de sortie
+
+        Raises:
+            Exception: Toute erreur PyAV (l'appelant se replie sur FFmpeg)
+        """
+        av = video_service.av
+        width = self.TARGET_FORMAT["width"]
+        height = self.TARGET_FORMAT["height"]
+        fps = self.TARGET_FORMAT["fps"]
+
+        with av.open(str(image_path)) as image_container:
+            image = next(image_container.decode(video=0))
+        frame = image.reformat(width=width, height=height, format="yuv420p")
+
+        # NVENC utilisable depuis PyAV ; les autres encodeurs matériels
+        # demandent des frames GPU, on reste alors sur libx264
+        codec = "h264_nvenc" if self.video_encoder == "h264_nvenc" else "libx264"
+
+        with av.open(str(output_path), "w") as container:
+            stream = container.add_stream(codec, rate=fps)
+            stream.width = width
+            stream.height = height
+            stream.pix_fmt = "yuv420p"
+            stream.codec_context.gop_size = fps  # Une image clé par seconde
+            if codec == "libx264":
+                stream.options = {
+                    "preset": self.TARGET_FORMAT["preset"],
+                    "crf": str(self.TARGET_FORMAT["crf"]),
+                    "tune": "stillimage",
+                }
+
+            for index in range(duration * fps):
+                frame.pts = index
+                container.mux(stream.encode(frame))
+            container.mux(stream.encode(None))  # Vider l'encodeur
+
     def detect_video_format(self, video_path: Path) -> Optional[VideoFormat]:
         """
-        Analyse le format d'une vidéo avec ffprobe
+        Analyse le format d'une vidéo, avec cache par (chemin, mtime, taille)
+
+        Un fichier inchangé n'est analysé qu'une fois, y compris entre deux
+        redémarrages grâce au cache persisté dans video_cache_dir.
+
+        Args:
+            video_path: Chemin de la vidéo à analyser
+
+        Returns:
+            VideoFormat avec les informations ou None si erreur
+        """
+        video_format, probed = self._detect_format_cached(video_path)
+        if probed:
+            self._save_format_cache()
+        return video_format
+
+    def _detect_format_cached(
+        self, video_path: Path
+    ) -> Tuple[Optional[VideoFormat], bool]:
+        """
+        Analyse le format d'une vidéo via le cache mémoire, sans le persister
+
+        Args:
+            video_path: Chemin de la vidéo à analyser
+
+        Returns:
+            (VideoFormat ou None si erreur, True si une analyse a été ajoutée
+            au cache)
+        """
+        try:
+            st = video_path.stat()
+        except OSError as e:
+            logger.error(f"Vidéo inaccessible {video_path}: {e}")
+            return None, False
+
+        key = (video_path.resolve().as_posix(), st.st_mtime_ns, st.st_size)
+        with self._format_cache_lock:
+            cached = self._format_cache.get(key)
+        if cached is not None:
+            return cached, False
+
+        video_format = self._probe_video_format(video_path)
+        if video_format is None:
+            return None, False
+        with self._format_cache_lock:
+            self._format_cache[key] = video_format
+        return video_format, True
+
+    def _detect_formats_batch(
+        self, video_paths: List[Path]
+    ) -> List[Optional[VideoFormat]]:
+        """
+        Analyse le format de plusieurs vidéos en une seule passe parallèle
+
+        Chaque fichier distinct n'est sondé qu'une fois, même s'il apparaît
+        plusieurs fois dans la liste ; PyAV et ffprobe libèrent le GIL
+        pendant l'I/O, les probes se recouvrent donc dans le pool.
+
+        Args:
+            video_paths: Vidéos à analyser, dans l'ordre
+
+        Returns:
+            Formats dans le même ordre (None si analyse impossible)
+        """
+        unique_paths = list(dict.fromkeys(video_paths))
+        if not unique_paths:
+            return []
+
+        workers = min(len(unique_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = dict(
+                zip(
+                    unique_paths, executor.map(self._detect_format_cached, unique_paths)
+                )
+            )
+        # Une seule écriture du cache disque pour tout le lot
+        if any(probed for _, probed in results.values()):
+            self._save_format_cache()
+        return [results[path][0] for path in video_paths]
+
+    def _probe_video_format(self, video_path: Path) -> Optional[VideoFormat]:
+        """
+        Analyse le format d'une vidéo (PyAV si installé, sinon ffprobe)
 
         Args:
             video_path: Chemin de la vidéo à analyser
@@ -229,14 +584,21 @@ class OptimizedVideoService(VideoService):
         Returns:
             VideoFormat avec les informations ou None si erreur
         """
+        if video_service.PYAV_AVAILABLE:
+            try:
+                return self._detect_format_pyav(video_path)
+            except Exception as e:
+                logger.debug(f"PyAV n'a pas pu lire {video_path}, repli ffprobe: {e}")
+
         try:
             command = [
-                "ffprobe",
+                self.ffprobe_path or "ffprobe",
                 "-v",
                 "quiet",
                 "-print_format",
                 "json",
-                "-show_streams",
+                "-show_entries",
+                "stream=codec_name,width,height,r_frame_rate,bit_rate,pix_fmt",
                 "-select_streams",
                 "v:0",  # Premier flux vidéo uniquement
                 str(video_path),
@@ -270,6 +632,7 @@ class OptimizedVideoService(VideoService):
                 bitrate=int(stream.get("bit_rate", 0))
                 if stream.get("bit_rate")
                 else None,
+                pix_fmt=stream.get("pix_fmt"),
             )
 
             logger.debug(
@@ -289,127 +652,147 @@ class OptimizedVideoService(VideoService):
             logger.error(f"Erreur inattendue lors de l'analyse de {video_path}: {e}")
             return None
 
-    def _concat_two_videos(
-        self, video1: Path, video2: Path, output: Path, use_stream_copy: bool = False
+    def _concat_videos(
+        self, videos: List[Path], output: Path, use_stream_copy: bool = False
     ) -> bool:
         """
-        Concatène deux vidéos en une seule
+        Concatène une liste de vidéos en un seul appel FFmpeg
+
+        La liste est transmise au demuxer concat sur stdin (pas de fichier
+        temporaire) ; un même fichier peut y figurer plusieurs fois.
 
         Args:
-            video1: Première vidéo
-            video2: Deuxième vidéo
+            videos: Vidéos à concaténer, dans l'ordre
             output: Fichier de sortie
             use_stream_copy: Si True, utilise -c copy (plus rapide mais formats doivent être identiques)
 
         Returns:
             True si succès, False sinon
         """
-        temp_dir = Path(tempfile.gettempdir())
-        concat_file = temp_dir / f"concat_{os.getpid()}_{time.time_ns()}.txt"
+        ffmpeg_path = self.ffmpeg_path
+        if not ffmpeg_path:
+            logger.error("FFmpeg introuvable")
+            return False
 
-        try:
-            # Créer le fichier de concaténation
-            with open(concat_file, "w") as f:
-                f.write(f"file '{video1.absolute()}'\n")
-                f.write(f"file '{video2.absolute()}'\n")
-
-            # Trouver ffmpeg
-            ffmpeg_path = shutil.which("ffmpeg")
-            if not ffmpeg_path:
-                logger.error("FFmpeg introuvable")
-                return False
+        concat_manifest = "".join(f"file '{video.absolute()}'\n" for video in videos)
 
-            if use_stream_copy:
-                # Mode stream copy - très rapide mais requiert formats identiques
-                command = [
-                    ffmpeg_path,
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(concat_file),
-                    "-c",
-                    "copy",  # Stream copy - pas de ré-encodage
-                    "-y",
-                    str(output),
-                ]
-            else:
-                # Mode ré-encodage - plus lent mais gère tous les formats
-                command = [
-                    ffmpeg_path,
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(concat_file),
-                    "-c:v",
-                    self.TARGET_FORMAT["codec"],
-                    "-preset",
-                    self.TARGET_FORMAT["preset"],
-                    "-crf",
-                    str(self.TARGET_FORMAT["crf"]),
+        if use_stream_copy:
+            input_args, hw_filters, encoder_args = [], [], []
+        else:
+            input_args, hw_filters, encoder_args = self._target_encode_args()
+
+        command = [
+            ffmpeg_path,
+            *input_args,
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-protocol_whitelist",
+            "file,pipe",
+            "-i",
+            "pipe:0",
+        ]
+        if use_stream_copy:
+            # Mode stream copy - très rapide mais requiert formats identiques
+            command.extend(["-c", "copy"])  # Stream copy - pas de ré-encodage
+        else:
+            # Mode ré-encodage - plus lent mais gère tous les formats
+            command.extend(
+                [
+                    *encoder_args,
                     "-vf",
-                    f"scale={self.TARGET_FORMAT['width']}:{self.TARGET_FORMAT['height']}",
+                    ",".join(
+                        [
+                            f"scale={self.TARGET_FORMAT['width']}:{self.TARGET_FORMAT['height']}",
+                            *hw_filters,
+                        ]
+                    ),
                     "-r",
                     str(self.TARGET_FORMAT["fps"]),
-                    "-pix_fmt",
-                    "yuv420p",
+                    "-threads",
+                    "0",  # Autant de threads que de coeurs
                     "-an",  # Pas d'audio
-                    "-y",
-                    str(output),
                 ]
+            )
+        command.extend(["-y", str(output)])
 
+        try:
             logger.debug(f"Commande concat: {' '.join(command)}")
-
-            subprocess.run(command, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                command,
+                input=concat_manifest,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if result.returncode != 0:
+                logger.error(
+                    f"Erreur FFmpeg concat (rc={result.returncode}): "
+                    f"{result.stderr[-STDERR_TAIL_CHARS:]}"
+                )
+                return False
 
             return output.exists()
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Erreur FFmpeg concat: {e.stderr}")
-            return False
         except Exception as e:
             logger.error(f"Erreur inattendue concat: {e}")
             return False
-        finally:
-            # Nettoyage du fichier concat temporaire
-            if concat_file.exists():
-                concat_file.unlink()
 
-    def _normalize_video(self, input_path: Path, output_path: Path) -> bool:
+    def _concat_two_videos(
+        self, video1: Path, video2: Path, output: Path, use_stream_copy: bool = False
+    ) -> bool:
+        """
+        Concatène deux vidéos en une seule
+
+        Args:
+            video1: Première vidéo
+            video2: Deuxième vidéo
+            output: Fichier de sortie
+            use_stream_copy: Si True, utilise -c copy (plus rapide mais formats doivent être identiques)
+
+        Returns:
+            True si succès, False sinon
+        """
+        return self._concat_videos([video1, video2], output, use_stream_copy)
+
+    def _normalize_video(
+        self, input_path: Path, output_path: Path, threads: int = 0
+    ) -> bool:
         """
         Normalise une vidéo au format cible (720p H.264 30fps)
 
         Args:
             input_path: Vidéo source
             output_path: Vidéo normalisée
+            threads: Nombre de threads FFmpeg (0: autant que de coeurs)
 
         Returns:
             True si succès, False sinon
         """
-        ffmpeg_path = shutil.which("ffmpeg")
+        ffmpeg_path = self.ffmpeg_path
         if not ffmpeg_path:
             logger.error("FFmpeg introuvable")
             return False
 
+        input_args, hw_filters, encoder_args = self._target_encode_args()
         command = [
             ffmpeg_path,
+            *input_args,
             "-i",
             str(input_path),
-            "-c:v",
-            self.TARGET_FORMAT["codec"],
-            "-preset",
-            self.TARGET_FORMAT["preset"],
-            "-crf",
-            str(self.TARGET_FORMAT["crf"]),
+            *encoder_args,
             "-vf",
-            f"scale={self.TARGET_FORMAT['width']}:{self.TARGET_FORMAT['height']}",
+            ",".join(
+                [
+                    f"scale={self.TARGET_FORMAT['width']}:{self.TARGET_FORMAT['height']}",
+                    *hw_filters,
+                ]
+            ),
             "-r",
             str(self.TARGET_FORMAT["fps"]),
-            "-pix_fmt",
-            "yuv420p",
+            "-threads",
+            str(threads),
             "-an",
             "-y",
             str(output_path),
@@ -422,58 +805,151 @@ class OptimizedVideoService(VideoService):
             logger.error(f"Erreur normalisation vidéo: {e.stderr}")
             return False
 
-    def _download_videos_parallel(
-        self, exercises: List[Exercise]
-    ) -> Dict[str, Optional[Path]]:
+    def _normalize_and_cache_exercise_video(self, video_path: Path) -> Optional[Path]:
         """
-        Télécharge les vidéos des exercices en parallèle
+        Retourne une version de la vidéo au format cible, normalisée une fois
+
+        Les vidéos déjà au format cible sont utilisées telles quelles. Les
+        autres sont ré-encodées une seule fois dans normalized_dir ; la clé
+        inclut mtime et taille de la source, ainsi que _encode_signature,
+        pour invalider le cache si la source ou le format cible change.
+        Toutes les entrées partagent alors le même format et la concaténation
+        peut se faire en stream copy.
 
         Args:
-            exercises: Liste des exercices
+            video_path: Vidéo source
 
         Returns:
-            Dict mapping nom exercice -> chemin local
+            Chemin de la vidéo au format cible ou None si erreur
+        """
+        video_format = self.detect_video_format(video_path)
+        if video_format is not None and video_format.is_target_format:
+            return video_path
+
+        try:
+            st = video_path.stat()
+        except OSError as e:
+            logger.error(f"Vidéo inaccessible {video_path}: {e}")
+            return None
+
+        cache_key = hashlib.sha1(
+            f"{video_path.resolve()}:{st.st_mtime_ns}:{st.st_size}:"
+            f"{self._encode_signature()}".encode()
+        ).hexdigest()
+        normalized_path = self.normalized_dir / f"{cache_key}.mp4"
+        if normalized_path.exists():
+            return normalized_path
+
+        # Écriture dans un fichier temporaire puis renommage atomique: une
+        # normalisation interrompue ne laisse pas de fichier partiel en cache
+        tmp_path = self.normalized_dir / f"{cache_key}.{threading.get_ident()}.tmp.mp4"
+        if not self._normalize_video(
+            video_path, tmp_path, threads=self.NORMALIZE_THREADS
+        ):
+            tmp_path.unlink(missing_ok=True)
+            return None
+        os.replace(tmp_path, normalized_path)
+        logger.info(f"Vidéo normalisée mise en cache: {video_path.name}")
+        return normalized_path
+
+    def _normalize_workers(self, count: int) -> int:
+        """
+        Nombre de normalisations simultanées pour count vidéos
+
+        Choisi pour que (processus x NORMALIZE_THREADS) corresponde au nombre
+        de coeurs.
         """
+        return max(1, min(count, (os.cpu_count() or 1) // self.NORMALIZE_THREADS))
+
+    def _normalize_all(self, video_paths: List[Path]) -> List[Optional[Path]]:
+        """
+        Normalise toutes les vidéos en parallèle, une FFmpeg par vidéo
+
+        Le nombre de normalisations simultanées est donné par
+        _normalize_workers.
+
+        Args:
+            video_paths: Vidéos sources, dans l'ordre
+
+        Returns:
+            Chemins au format cible, dans le même ordre (None si échec)
+        """
+        if not video_paths:
+            return []
+
+        workers = self._normalize_workers(len(video_paths))
         logger.info(
-            f"=== DÉBUT TÉLÉCHARGEMENT PARALLÈLE: {len(exercises)} exercices ({self.max_parallel_downloads} threads) ==="
+            f"Normalisation de {len(video_paths)} vidéos ({workers} en parallèle)"
         )
-        start_time = time.time()
 
-        results = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(self._normalize_and_cache_exercise_video, video_paths)
+            )
+
+    def _iter_downloads_parallel(
+        self, exercises: List[Exercise]
+    ) -> Iterator[Tuple[int, str, Optional[Path]]]:
+        """
+        Télécharge les vidéos en parallèle et les fournit au fil de l'eau
 
-        def download_single(exercise: Exercise) -> Tuple[str, Optional[Path]]:
+        Args:
+            exercises: Liste des exercices
+
+        Yields:
+            Tuple (index de l'exercice, nom, chemin local ou None), dans
+            l'ordre de fin des téléchargements
+        """
+
+        def download_single(exercise: Exercise) -> Optional[Path]:
             """Télécharge une seule vidéo"""
             download_start = time.time()
-            logger.info(f"⏱️ Début résolution: {exercise.name}")
             path = self._resolve_video_path(exercise)
-            download_time = (time.time() - download_start) * 1000
-            logger.info(f"⏱️ Fin résolution: {exercise.name} en {download_time:.0f}ms")
-            return (exercise.name, path)
+            logger.debug(
+                "⏱️ Résolution: %s en %.0fms",
+                exercise.name,
+                (time.time() - download_start) * 1000,
+            )
+            return path
 
         with ThreadPoolExecutor(max_workers=self.max_parallel_downloads) as executor:
-            futures = {executor.submit(download_single, ex): ex for ex in exercises}
+            futures = {
+                executor.submit(download_single, exercise): index
+                for index, exercise in enumerate(exercises)
+            }
 
-            completed_count = 0
             for future in as_completed(futures):
-                exercise = futures[future]
+                index = futures[future]
+                exercise = exercises[index]
                 try:
-                    name, path = future.result()
-                    results[name] = path
-                    completed_count += 1
-
-                    if path and path.exists():
-                        size_kb = path.stat().st_size / 1024
-                        logger.info(
-                            f"✓ [{completed_count}/{len(exercises)}] {name}: {size_kb:.1f}KB"
-                        )
-                    else:
-                        logger.error(
-                            f"✗ [{completed_count}/{len(exercises)}] {name}: téléchargement échoué"
-                        )
-
+                    path = future.result()
                 except Exception as e:
                     logger.error(f"✗ {exercise.name}: erreur - {e}")
-                    results[exercise.name] = None
+                    path = None
+                yield index, exercise.name, path
+
+    def _download_videos_parallel(
+        self, exercises: List[Exercise]
+    ) -> Dict[str, Optional[Path]]:
+        """
+        Télécharge les vidéos des exercices en parallèle
+
+        Args:
+            exercises: Liste des exercices
+
+        Returns:
+            Dict mapping nom exercice -> chemin local
+        """
+        logger.info(
+            f"=== DÉBUT TÉLÉCHARGEMENT PARALLÈLE: {len(exercises)} exercices ({self.max_parallel_downloads} threads) ==="
+        )
+        start_time = time.time()
+
+        results = {}
+        for _, name, path in self._iter_downloads_parallel(exercises):
+            results[name] = path
+            if path is None:
+                logger.error(f"✗ {name}: téléchargement échoué")
 
         total_time = (time.time() - start_time) * 1000
         success_count = sum(1 for p in results.values() if p is not None)
@@ -484,6 +960,44 @@ class OptimizedVideoService(VideoService):
 
         return results
 
+    def _download_and_normalize_all(
+        self, exercises: List[Exercise]
+    ) -> List[Optional[Path]]:
+        """
+        Télécharge et normalise les vidéos, chaque normalisation démarrant dès
+        la fin du téléchargement correspondant
+
+        Le réseau et l'encodage se recouvrent au lieu de se succéder : la
+        durée totale tend vers max(téléchargements, normalisations).
+
+        Args:
+            exercises: Liste des exercices
+
+        Returns:
+            Chemins au format cible, dans l'ordre des exercices (None si échec)
+        """
+        normalized: List[Optional[Path]] = [None] * len(exercises)
+        if not exercises:
+            return normalized
+
+        with ThreadPoolExecutor(
+            max_workers=self._normalize_workers(len(exercises))
+        ) as executor:
+            futures = {}
+            for index, name, path in self._iter_downloads_parallel(exercises):
+                if path and path.exists():
+                    future = executor.submit(
+                        self._normalize_and_cache_exercise_video, path
+                    )
+                    futures[future] = index
+                else:
+                    logger.error(f"Vidéo manquante pour {name}")
+
+            for future, index in futures.items():
+                normalized[index] = future.result()
+
+        return normalized
+
     def build_progressive_concat(
         self,
         video_paths: List[Path],
@@ -492,20 +1006,19 @@ class OptimizedVideoService(VideoService):
         cleanup_intermediates: bool = True,
     ) -> bool:
         """
-        Construit la vidéo finale par concaténation progressive
+        Construit la vidéo finale en une seule passe de concaténation
 
-        Logique:
-        temp_0 = video_1
-        temp_1 = concat(temp_0, break_1)
-        temp_2 = concat(temp_1, video_2)
-        temp_3 = concat(temp_2, break_2)
-        ...
+        Toutes les vidéos et tous les breaks sont listés, dans l'ordre, dans un
+        unique manifeste concat : chaque frame est décodée et encodée une seule
+        fois, sans fichiers intermédiaires (l'ancien enchaînement deux à deux
+        ré-encodait k clips à l'étape k, soit un coût en O(N²)).
 
         Args:
             video_paths: Liste des chemins des vidéos d'exercices
             break_paths: Liste des chemins des breaks (peut contenir None pour dernier ex)
             output_path: Chemin du fichier final
-            cleanup_intermediates: Si True, supprime les fichiers intermédiaires
+            cleanup_intermediates: Conservé pour compatibilité (plus aucun
+                fichier intermédiaire n'est produit)
 
         Returns:
             True si succès, False sinon
@@ -514,29 +1027,15 @@ class OptimizedVideoService(VideoService):
             logger.error("Aucune vidéo à concaténer")
             return False
 
-        logger.info(f"=== CONCATÉNATION PROGRESSIVE ({len(video_paths)} exercices) ===")
+        logger.info(f"=== CONCATÉNATION ({len(video_paths)} exercices) ===")
         total_start = time.time()
 
-        temp_dir = Path(tempfile.gettempdir())
-
         # Analyser les formats pour déterminer si on peut utiliser stream copy
         logger.info("Analyse des formats vidéo...")
-        all_same_format = True
-        reference_format = None
 
-        for i, video_path in enumerate(video_paths):
-            video_format = self.detect_video_format(video_path)
-            if video_format:
-                if reference_format is None:
-                    reference_format = video_format
-                elif (
-                    video_format.codec != reference_format.codec
-                    or video_format.width != reference_format.width
-                    or video_format.height != reference_format.height
-                ):
-                    all_same_format = False
-                    logger.info(f"Format différent détecté pour vidéo {i+1}")
-                    break
+        # Les breaks sont générés au format cible: seules les vidéos sont sondées
+        video_formats = self._detect_formats_batch(video_paths)
+        reference_format = next((fmt for fmt in video_formats if fmt), None)
 
         # Si un seul exercice, juste copier/normaliser
         if len(video_paths) == 1:
@@ -547,112 +1046,71 @@ class OptimizedVideoService(VideoService):
                 self._normalize_video(video_paths[0], output_path)
             return output_path.exists()
 
-        # Décider du mode de concaténation
-        use_stream_copy = (
-            all_same_format and reference_format and reference_format.is_target_format
-        )
+        # Seules les vidéos hors format cible sont normalisées ; les autres
+        # sont reprises telles quelles dans la concaténation en stream copy
+        needs_normalization = [
+            fmt is None or not fmt.is_target_format for fmt in video_formats
+        ]
+        use_stream_copy = True
+        if any(needs_normalization):
+            logger.info(
+                f"⚠ {sum(needs_normalization)}/{len(video_paths)} vidéo(s) hors "
+                f"format cible, normalisation ciblée"
+            )
+            normalized = iter(
+                self._normalize_all(
+                    [
+                        path
+                        for path, needed in zip(video_paths, needs_normalization)
+                        if needed
+                    ]
+                )
+            )
+            candidate_paths = [
+                next(normalized) if needed else path
+                for path, needed in zip(video_paths, needs_normalization)
+            ]
+            if all(candidate_paths):
+                video_paths = candidate_paths
+            else:
+                # Repli: ré-encodage complet pendant la concaténation
+                use_stream_copy = False
 
         if use_stream_copy:
             logger.info("✓ Stream copy activé - tous les fichiers sont au format cible")
         else:
             logger.info("⚠ Ré-encodage nécessaire - formats hétérogènes")
 
-        # Normaliser la première vidéo si nécessaire
-        current_temp = temp_dir / f"progressive_0_{os.getpid()}.mp4"
-
-        if use_stream_copy:
-            shutil.copy2(video_paths[0], current_temp)
-        else:
-            logger.info(f"Normalisation vidéo 1/{len(video_paths)}...")
-            if not self._normalize_video(video_paths[0], current_temp):
-                logger.error("Échec normalisation première vidéo")
-                return False
-
-        step_times = []
-        previous_temp = None
-
-        # Concaténation progressive
-        for i in range(len(video_paths)):
-            step_start = time.time()
-
-            # Si pas la première vidéo, concaténer avec le résultat précédent
-            if i > 0:
-                # Normaliser la vidéo si nécessaire
-                if use_stream_copy:
-                    video_to_add = video_paths[i]
-                else:
-                    normalized_video = temp_dir / f"normalized_{i}_{os.getpid()}.mp4"
-                    logger.info(f"Normalisation vidéo {i+1}/{len(video_paths)}...")
-                    if not self._normalize_video(video_paths[i], normalized_video):
-                        logger.error(f"Échec normalisation vidéo {i+1}")
-                        return False
-                    video_to_add = normalized_video
-
-                # Concaténer
-                next_temp = temp_dir / f"progressive_{i*2}_{os.getpid()}.mp4"
-                logger.info(f"Concat vidéo {i+1}...")
-
-                if not self._concat_two_videos(
-                    current_temp,
-                    video_to_add,
-                    next_temp,
-                    use_stream_copy=use_stream_copy,
-                ):
-                    logger.error(f"Échec concat vidéo {i+1}")
-                    return False
-
-                # Nettoyage
-                if cleanup_intermediates:
-                    if previous_temp and previous_temp.exists():
-                        previous_temp.unlink()
-                    if not use_stream_copy and normalized_video.exists():
-                        normalized_video.unlink()
-
-                previous_temp = current_temp
-                current_temp = next_temp
-
-            # Ajouter le break si ce n'est pas le dernier exercice
-            if i < len(video_paths) - 1 and break_paths[i] is not None:
-                break_path = break_paths[i]
-
-                next_temp = temp_dir / f"progressive_{i*2+1}_{os.getpid()}.mp4"
-                logger.info(f"Concat break {i+1}...")
-
-                if not self._concat_two_videos(
-                    current_temp, break_path, next_temp, use_stream_copy=use_stream_copy
-                ):
-                    logger.error(f"Échec concat break {i+1}")
-                    return False
-
-                # Nettoyage
-                if cleanup_intermediates and previous_temp and previous_temp.exists():
-                    previous_temp.unlink()
-
-                previous_temp = current_temp
-                current_temp = next_temp
-
-            step_time = (time.time() - step_start) * 1000
-            step_times.append(step_time)
-            logger.info(f"⏱️ Étape {i+1} terminée en {step_time:.0f}ms")
-
-        # Déplacer le résultat final
-        shutil.move(current_temp, output_path)
-
-        # Nettoyage final
-        if cleanup_intermediates and previous_temp and previous_temp.exists():
-            previous_temp.unlink()
+        # Vidéos et breaks entrelacés dans l'ordre de lecture
+        concat_inputs = []
+        for i, video_path in enumerate(video_paths):
+            concat_inputs.append(video_path)
+            if (
+                i < len(video_paths) - 1
+                and i < len(break_paths)
+                and break_paths[i] is not None
+            ):
+                concat_inputs.append(break_paths[i])
+
+        if not self._concat_videos(
+            concat_inputs, output_path, use_stream_copy=use_stream_copy
+        ):
+            logger.error("Échec de la concaténation")
+            return False
 
         total_time = (time.time() - total_start) * 1000
-        avg_step_time = sum(step_times) / len(step_times) if step_times else 0
 
-        logger.info("=== RÉSUMÉ CONCATÉNATION PROGRESSIVE ===")
-        logger.info(f"⏱️ Temps total: {total_time:.0f}ms")
-        logger.info(f"⏱️ Temps moyen par étape: {avg_step_time:.0f}ms")
+        logger.info("=== RÉSUMÉ CONCATÉNATION ===")
         logger.info(
-            f"📦 Fichier final: {output_path.stat().st_size / (1024*1024):.2f}MB"
+            f"⏱️ Temps total: {total_time:.0f}ms ({len(concat_inputs)} fichiers)"
         )
+        # stat() uniquement si le log est émis (le succès est déjà établi)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "📦 Fichier final: %.2fMB", output_path.stat().st_size / (1024 * 1024)
+            )
 
-        return output_path.exists()
+        return True
 
     def generate_workout_video_progressive(
         self,
@@ -664,10 +1122,9 @@ class OptimizedVideoService(VideoService):
         Génère une vidéo d'entraînement avec concaténation progressive
 
         Cette méthode optimisée:
-        1. Télécharge les vidéos en parallèle
+        1. Télécharge les vidéos en parallèle, normalisées dès leur arrivée
         2. Utilise un cache de breaks pré-générés
-        3. Concatène progressivement pour limiter la mémoire
-        4. Nettoie les fichiers temporaires au fur et à mesure
+        3. Concatène vidéos et breaks en une seule passe FFmpeg
 
         Args:
             exercises: Liste des exercices
@@ -693,33 +1150,32 @@ class OptimizedVideoService(VideoService):
 
             temp_dir = Path(tempfile.gettempdir())
 
-            # Étape 1: Téléchargement parallèle des vidéos
+            # Étape 1: Téléchargement parallèle des vidéos, chacune normalisée
+            # au format cible (mise en cache) dès son arrivée pour permettre
+            # la concaténation en stream copy
             download_start = time.time()
-            video_map = self._download_videos_parallel(exercises)
+            video_paths = self._download_and_normalize_all(exercises)
+            if any(path is None for path in video_paths):
+                logger.error("Vidéo manquante ou échec de normalisation")
+                return False
             download_time = (time.time() - download_start) * 1000
+            logger.info(f"⏱️ Téléchargement + normalisation: {download_time:.0f}ms")
 
-            # Vérifier que toutes les vidéos sont disponibles
-            video_paths = []
-            for exercise in exercises:
-                path = video_map.get(exercise.name)
-                if path and path.exists():
-                    video_paths.append(path)
-                else:
-                    logger.error(f"Vidéo manquante pour {exercise.name}")
-                    return False
-
-            logger.info(f"⏱️ Téléchargement: {download_time:.0f}ms")
-
-            # Étape 2: Préparer les breaks (depuis le cache)
+            # Étape 2: Préparer le break (depuis le cache), une seule fois: le
+            # même fichier est référencé entre chaque exercice dans la concat
             break_start = time.time()
-            break_paths = []
-
-            for i in range(len(exercises) - 1):
+            break_path = None
+            if len(exercises) > 1:
                 break_path = self._get_or_create_break(rest_time, temp_dir)
-                break_paths.append(break_path)
+                if break_path is not None:
+                    # Au format cible pour rester compatible avec le stream copy
+                    break_path = self._normalize_and_cache_exercise_video(break_path)
+                    if break_path is None:
+                        logger.error(f"Échec normalisation du break {rest_time}s")
+                        return False
 
-            # Ajouter None pour le dernier exercice (pas de break après)
-            break_paths.append(None)
+            # None pour le dernier exercice (pas de break après)
+            break_paths = [break_path] * (len(exercises) - 1) + [None]
 
             break_time = (time.time() - break_start) * 1000
             logger.info(f"⏱️ Préparation breaks: {break_time:.0f}ms")
@@ -739,7 +1195,7 @@ class OptimizedVideoService(VideoService):
             logger.info("=" * 60)
             logger.info("=== RÉSUMÉ GÉNÉRATION OPTIMISÉE ===")
             logger.info(
-                f"⏱️ Téléchargement: {download_time:.0f}ms ({download_time/total_time*100:.1f}%)"
+                f"⏱️ Téléchargement + normalisation: {download_time:.0f}ms ({download_time/total_time*100:.1f}%)"
             )
             logger.info(
                 f"⏱️ Préparation breaks: {break_time:.0f}ms ({break_time/total_time*100:.1f}%)"
@@ -807,43 +1263,138 @@ class OptimizedVideoService(VideoService):
         logger.info("=== FALLBACK: Méthode classique ===")
         return super().generate_workout_video(exercises, config, output_path)
 
-    def cleanup_cache(self, max_age_hours: int = 24) -> int:
+    @staticmethod
+    def _is_break_file(name: str) -> bool:
         """
-        Nettoie les fichiers du cache plus vieux que max_age_hours
+        Indique si un fichier du cache est une vidéo de break
+
+        Couvre les breaks téléchargés ({hash}_break_{d}s), générés
+        (break_{d}s) et la seconde de break partagée (break_unit_*). Les
+        fichiers temporaires (*.tmp.mp4) d'un encodage interrompu n'en sont
+        pas : ils expirent avec l'âge comme les autres.
+        """
+        return "break_" in name and not name.endswith(".tmp.mp4")
+
+    @staticmethod
+    def _cache_io_workers() -> int:
+        """Nombre de threads pour les stat/unlink du cache (I/O, GIL relâché)"""
+        return min(32, (os.cpu_count() or 1) * 4)
+
+    def _scan_cache(self) -> Iterator[Tuple[os.DirEntry, os.stat_result, bool]]:
+        """
+        Parcourt une fois les fichiers du cache vidéo (os.scandir)
+
+        Couvre video_cache_dir et normalized_dir, dont les copies
+        normalisées expirent comme les vidéos téléchargées. Le type de
+        chaque entrée vient du DirEntry ; les stat() sont lancés en
+        parallèle (ils relâchent le GIL), ce qui compte surtout quand le
+        cache est sur un montage réseau.
+
+        Yields:
+            Tuple (entrée, stat, est un break) pour chaque fichier
+        """
+        files = []
+        for cache_dir in (self.video_cache_dir, self.normalized_dir):
+            try:
+                with os.scandir(cache_dir) as entries:
+                    files.extend(
+                        entry
+                        for entry in entries
+                        if entry.is_file(follow_symlinks=False)
+                    )
+            except FileNotFoundError:
+                continue  # normalized_dir supprimé à la main
+        if not files:
+            return
+
+        def stat_entry(entry: os.DirEntry) -> Optional[os.stat_result]:
+            try:
+                return entry.stat(follow_symlinks=False)
+            except OSError:
+                return None  # Supprimé entre-temps
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(files), self._cache_io_workers())
+        ) as executor:
+            stats = list(executor.map(stat_entry, files))
+
+        for entry, st in zip(files, stats):
+            if st is not None:
+                yield entry, st, self._is_break_file(entry.name)
+
+    def _cleanup_records(
+        self,
+        records: Iterable[Tuple[os.DirEntry, os.stat_result, bool]],
+        max_age_hours: int,
+    ) -> Tuple[int, List[Tuple[os.DirEntry, os.stat_result, bool]]]:
+        """
+        Supprime les fichiers trop vieux parmi les entrées parcourues
+
+        Les breaks sont conservés quel que soit leur âge, sauf les secondes
+        de break (break_unit_*) d'un autre encodeur ou d'un ancien
+        TARGET_FORMAT, jamais réutilisées. Le tri se fait dans le thread
+        appelant, les unlink() en parallèle.
 
         Args:
+            records: Entrées fournies par _scan_cache
             max_age_hours: Âge maximum des fichiers en heures
 
         Returns:
-            Nombre de fichiers supprimés
+            Tuple (nombre de fichiers supprimés, entrées conservées)
         """
-        import time
-
-        deleted_count = 0
+        kept = []
+        expired = []
         max_age_seconds = max_age_hours * 3600
         current_time = time.time()
+        current_break_unit = self._break_unit_name()
+
+        for record in records:
+            entry, st, is_break = record
+            if (
+                is_break
+                and entry.name.startswith("break_unit_")
+                and entry.name != current_break_unit
+            ):
+                expired.append(record)
+            # Ne pas supprimer les breaks (réutilisés d'une séance à l'autre)
+            elif is_break or current_time - st.st_mtime <= max_age_seconds:
+                kept.append(record)
+            else:
+                expired.append(record)
 
-        for cache_file in self.video_cache_dir.glob("*"):
-            if cache_file.is_file():
-                # Ne pas supprimer les breaks pré-générés
-                if cache_file.parent == self.break_cache_dir:
-                    continue
+        def unlink_entry(entry: os.DirEntry) -> bool:
+            try:
+                os.unlink(entry.path)
+            except OSError as e:
+                logger.warning("Impossible de supprimer %s: %s", entry.path, e)
+                return False
+            # Formatage différé : rien n'est construit si DEBUG est désactivé
+            logger.debug("Cache supprimé: %s", entry.path)
+            return True
 
-                file_age = current_time - cache_file.stat().st_mtime
-                if file_age > max_age_seconds:
-                    try:
-                        cache_file.unlink()
+        deleted_count = 0
+        if expired:
+            with ThreadPoolExecutor(
+                max_workers=min(len(expired), self._cache_io_workers())
+            ) as executor:
+                results = executor.map(unlink_entry, [entry for entry, _, _ in expired])
+                for record, deleted in zip(expired, results):
+                    if deleted:
                         deleted_count += 1
-                        logger.debug(f"Cache supprimé: {cache_file}")
-                    except Exception as e:
-                        logger.warning(f"Impossible de supprimer {cache_file}: {e}")
+                    else:
+                        kept.append(record)
 
         logger.info(f"Cache nettoyé: {deleted_count} fichiers supprimés")
-        return deleted_count
+        return deleted_count, kept
 
-    def get_cache_stats(self) -> Dict:
+    def _build_cache_stats(
+        self, records: Iterable[Tuple[os.DirEntry, os.stat_result, bool]]
+    ) -> Dict:
         """
-        Retourne des statistiques sur le cache
+        Agrège le nombre et la taille des vidéos et des breaks du cache
+
+        Args:
+            records: Entrées fournies par _scan_cache
 
         Returns:
             Dict avec les statistiques du cache
@@ -853,15 +1404,13 @@ class OptimizedVideoService(VideoService):
         break_count = 0
         break_size = 0
 
-        for cache_file in self.video_cache_dir.glob("*"):
-            if cache_file.is_file():
-                size = cache_file.stat().st_size
-                if cache_file.parent == self.break_cache_dir:
-                    break_count += 1
-                    break_size += size
-                else:
-                    video_count += 1
-                    video_size += size
+        for _, st, is_break in records:
+            if is_break:
+                break_count += 1
+                break_size += st.st_size
+            else:
+                video_count += 1
+                video_size += st.st_size
 
         return {
             "video_cache": {
@@ -871,8 +1420,44 @@ class OptimizedVideoService(VideoService):
             "break_cache": {
                 "count": break_count,
                 "size_mb": break_size / (1024 * 1024),
-                "durations": self.COMMON_BREAK_DURATIONS,
             },
             "cache_dir": str(self.video_cache_dir),
-            "break_cache_dir": str(self.break_cache_dir),
         }
+
+    def cleanup_cache(self, max_age_hours: int = 24) -> int:
+        """
+        Nettoie les fichiers du cache plus vieux que max_age_hours
+
+        Args:
+            max_age_hours: Âge maximum des fichiers en heures
+
+        Returns:
+            Nombre de fichiers supprimés
+        """
+        deleted_count, _ = self._cleanup_records(self._scan_cache(), max_age_hours)
+        return deleted_count
+
+    def get_cache_stats(self) -> Dict:
+        """
+        Retourne des statistiques sur le cache
+
+        Returns:
+            Dict avec les statistiques du cache
+        """
+        return self._build_cache_stats(self._scan_cache())
+
+    def cleanup_and_stats(self, max_age_hours: int = 24) -> Tuple[int, Dict]:
+        """
+        Nettoie le cache puis calcule ses statistiques en un seul parcours
+
+        Équivalent à cleanup_cache() suivi de get_cache_stats(), sans
+        relire le dossier.
+
+        Args:
+            max_age_hours: Âge maximum des fichiers en heures
+
+        Returns:
+            Tuple (nombre de fichiers supprimés, statistiques après nettoyage)
+        """
+        deleted_count, kept = self._cleanup_records(self._scan_cache(), max_age_hours)
+        return deleted_count, self._build_cache_stats(kept)
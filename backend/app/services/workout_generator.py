@@ -8,9 +8,26 @@ TODO: Migrer vers Supabase pour le chargement des exercices
 
 import json
 import random
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
-from uuid import uuid4
+from types import ModuleType
+from typing import FrozenSet, List, Dict, Optional, Tuple, Union
+from uuid import UUID, uuid4
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..models.config import WorkoutConfig
 from ..models.exercise import Exercise, Difficulty
@@ -20,11 +37,23 @@ from ..models.workout import Workout, WorkoutExercise
 # Chemin vers le fichier JSON des exercices
 EXERCISES_FILE = Path(__file__).parent.parent / "models" / "exercises.json"
 
+# Exercices déjà validés, clé (chemin, mtime_ns) : le fichier n'est relu que
+# s'il a été modifié
+_EXERCISES_CACHE: Dict[Tuple[str, int], List[Exercise]] = {}
+
+# Pools filtrés par (no_jump, niveaux) pour une liste source donnée : vidés
+# dès que la source change (rechargement du cache de api.exercises)
+_FilteredPools = Dict[Tuple[bool, FrozenSet[Difficulty]], List[Exercise]]
+_filtered_pools: Tuple[Optional[List[Exercise]], _FilteredPools] = (None, {})
+
 
 def load_exercises_from_json() -> List[Exercise]:
     """
     Charge tous les exercices depuis le fichier exercises.json.
 
+    Le résultat est mis en cache tant que le fichier n'est pas modifié
+    (mtime) : les UUID générés restent donc stables d'un appel à l'autre.
+
     Returns:
         List[Exercise]: Liste complète des exercices validés par Pydantic
 
@@ -50,17 +79,34 @@ def load_exercises_from_json() -> List[Exercise]:
                 f"Fichier exercises.json introuvable: {EXERCISES_FILE}"
             )
 
-        with open(EXERCISES_FILE, "r", encoding="utf-8") as f:
-            exercises_data = json.load(f)
+        try:
+            st = EXERCISES_FILE.stat()
+            cache_key = (str(EXERCISES_FILE), st.st_mtime_ns)
+        except OSError:
+            cache_key = None  # Fichier inaccessible: lecture sans cache
+
+        cached = _EXERCISES_CACHE.get(cache_key)
+        if cached is not None:
+            # Copie de la liste: les appelants peuvent la filtrer ou la trier
+            return list(cached)
+
+        with open(EXERCISES_FILE, "rb") as f:
+            raw = f.read()
+        # orjson si installé (orjson.JSONDecodeError hérite de json.JSONDecodeError)
+        exercises_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
         # Générer des UUID pour les exercices qui n'en ont pas
         exercises = []
         for ex_data in exercises_data:
             if "id" not in ex_data or ex_data["id"] is None:
-                ex_data["id"] = str(uuid4())
+                ex_data["id"] = uuid4()  # UUID direct: ni formatage ni re-parsing
             exercises.append(Exercise(**ex_data))
 
-        return exercises
+        if cache_key is not None:
+            _EXERCISES_CACHE.clear()  # Une seule version du fichier en cache
+            _EXERCISES_CACHE[cache_key] = exercises
+
+        return list(exercises)
 
     except FileNotFoundError:
         raise
@@ -98,15 +144,20 @@ def filter_exercises(
         >>> filtered[0].name
         'Push-ups'
     """
-    filtered = exercises
-
-    # Filtrage par sauts
-    if no_jump:
-        filtered = [ex for ex in filtered if not ex.has_jump]
-
-    # Filtrage par difficulté
-    if intensity_levels:
-        filtered = [ex for ex in filtered if ex.difficulty in intensity_levels]
+    if not no_jump and not intensity_levels:
+        # Aucun filtre actif: simple copie, sans évaluer de prédicat
+        filtered = list(exercises)
+    else:
+        # Niveaux acceptés en frozenset (appartenance en O(1)), None: tous
+        levels = frozenset(intensity_levels) if intensity_levels else None
+
+        # Filtrage par sauts et par difficulté en une seule passe
+        filtered = [
+            ex
+            for ex in exercises
+            if (not no_jump or not ex.has_jump)
+            and (levels is None or ex.difficulty in levels)
+        ]
 
     # Validation du pool résultant
     if not filtered:
@@ -134,7 +185,8 @@ def generate_random_exercises(
         List[Exercise]: Exercices sélectionnés (peut contenir des doublons non consécutifs)
 
     Note:
-        Évite qu'un exercice soit identique à l'un des 2 exercices précédents.
+        Évite qu'un exercice soit identique à l'un des 2 exercices précédents
+        (comparaison par position dans le pool).
         Si le pool contient moins de 3 exercices, cette contrainte peut être
         partiellement respectée selon le nombre d'exercices disponibles.
 
@@ -164,36 +216,101 @@ def generate_random_exercises(
                 result.append(exercises_pool[i % 2])
             return result
 
-    selected_exercises = []
+    # Tirages groupés (sur-échantillonnés de 50% pour les rejets) puis
+    # rejet des indices égaux à l'un des 2 précédents : pas de pool filtré
+    # reconstruit à chaque exercice
+    pool_size = len(exercises_pool)
+    batch_size = count + count // 2 + 2
+    draws = _draw_indices(pool_size, batch_size)
+    cursor = 0
 
-    for i in range(count):
-        if i < 2:
-            # Pour les 2 premiers exercices : tirage aléatoire simple
-            # mais on évite quand même le précédent si i == 1
-            if i == 0:
-                exercise = random.choice(exercises_pool)
-            else:  # i == 1
-                previous = selected_exercises[0]
-                available_pool = [ex for ex in exercises_pool if ex.id != previous.id]
-                exercise = random.choice(available_pool)
-        else:
-            # Pour les exercices suivants : éviter les 2 précédents
-            prev_1 = selected_exercises[-1]
-            prev_2 = selected_exercises[-2]
-
-            # Créer un pool sans les 2 exercices précédents
-            available_pool = [
-                ex for ex in exercises_pool if ex.id != prev_1.id and ex.id != prev_2.id
-            ]
-
-            # Tirer un exercice du pool filtré
-            exercise = random.choice(available_pool)
-
-        selected_exercises.append(exercise)
+    # Indices des 2 exercices précédents (-1: aucun)
+    prev_1_idx = prev_2_idx = -1
+    selected_exercises = []
+    while len(selected_exercises) < count:
+        if cursor == len(draws):
+            draws = _draw_indices(pool_size, batch_size)
+            cursor = 0
+        index = draws[cursor]
+        cursor += 1
+        if index != prev_1_idx and index != prev_2_idx:
+            selected_exercises.append(exercises_pool[index])
+            prev_2_idx, prev_1_idx = prev_1_idx, index
 
     return selected_exercises
 
 
+def _draw_indices(pool_size: int, size: int) -> List[int]:
+    """
+    Tire size indices uniformément dans [0, pool_size) en un seul appel.
+
+    Args:
+        pool_size: Taille du pool d'exercices
+        size: Nombre d'indices à tirer
+
+    Returns:
+        List[int]: Indices tirés avec remise
+    """
+    if NUMPY_AVAILABLE:
+        return np.random.randint(0, pool_size, size=size).tolist()
+    return random.choices(range(pool_size), k=size)
+
+
+def _filtered_pool(
+    source: List[Exercise], no_jump: bool, intensity_levels: List[Difficulty]
+) -> List[Exercise]:
+    """
+    Retourne le pool filtré de source, calculé une fois par combinaison.
+
+    Les combinaisons (no_jump, niveaux) sont peu nombreuses : le filtrage
+    n'est refait qu'au rechargement de la liste source (identité).
+
+    Args:
+        source: Liste partagée des exercices (ne doit pas être modifiée)
+        no_jump: Si True, exclut les exercices avec has_jump=True
+        intensity_levels: Liste des niveaux de difficulté acceptés
+
+    Returns:
+        List[Exercise]: Pool filtré partagé (lecture seule)
+
+    Raises:
+        ValueError: Si aucun exercice ne correspond aux critères de filtrage
+    """
+    global _filtered_pools
+
+    # Source et pools remplacés ensemble (affectation atomique du tuple)
+    cached_source, pools = _filtered_pools
+    if cached_source is not source:
+        pools = {}
+        _filtered_pools = (source, pools)
+
+    key = (no_jump, frozenset(intensity_levels))
+    pool = pools.get(key)
+    if pool is None:
+        pool = filter_exercises(source, no_jump, intensity_levels)
+        pools[key] = pool
+    return pool
+
+
+@lru_cache(maxsize=1)
+def _exercises_api() -> ModuleType:
+    """
+    Retourne le module api.exercises, importé une seule fois.
+
+    Import différé (le module charge la configuration Supabase au
+    chargement) ; le module est renvoyé plutôt que la fonction pour que
+    get_cached_exercises, lu au moment de l'appel, reste remplaçable
+    (patch) dans les tests. Patcher load_exercises n'a aucun effet sur
+    generate_workout_exercises.
+
+    Returns:
+        ModuleType: Module app.api.exercises
+    """
+    from ..api import exercises
+
+    return exercises
+
+
 def generate_workout_exercises(workout: Workout) -> List[WorkoutExercise]:
     """
     Génère la liste complète des exercices pour un workout.
@@ -247,14 +364,12 @@ def generate_workout_exercises(workout: Workout) -> List[WorkoutExercise]:
             f"total_duration doit être positif, reçu: {workout.total_duration}"
         )
 
-    # 2. Charger tous les exercices disponibles depuis Supabase
-    from ..api.exercises import load_exercises
-
-    all_exercises = load_exercises()
+    # 2. Charger tous les exercices disponibles depuis Supabase (liste partagée)
+    all_exercises = _exercises_api().get_cached_exercises()
 
-    # 3. Filtrer selon les critères de configuration
-    filtered_exercises = filter_exercises(
-        exercises=all_exercises,
+    # 3. Filtrer selon les critères de configuration (mémorisé par source)
+    filtered_exercises = _filtered_pool(
+        source=all_exercises,
         no_jump=workout.config.no_jump,
         intensity_levels=workout.config.exercice_intensity_levels,
     )
@@ -275,21 +390,34 @@ def generate_workout_exercises(workout: Workout) -> List[WorkoutExercise]:
     )
 
     # 6. Créer les WorkoutExercise avec order_index séquentiel
-    workout_exercises = []
-    for index, exercise in enumerate(selected_exercises):
-        workout_exercise = WorkoutExercise(
+    # model_construct: ids déjà validés et index >= 0, la validation est inutile
+    construct = WorkoutExercise.model_construct
+    return [
+        construct(
             exercise_id=exercise.id,
             order_index=index,
             custom_duration=None,  # Utiliser default_duration de l'exercice
         )
-        workout_exercises.append(workout_exercise)
+        for index, exercise in enumerate(selected_exercises)
+    ]
 
-    return workout_exercises
+
+@dataclass(slots=True, frozen=True)
+class WorkoutItem:
+    """Élément de la séquence d'un workout : exercice ou break"""
+
+    name: str
+    description: str
+    icon: Optional[str]
+    duration: int
+    order: int
+    is_break: bool
+    exercise_id: Union[UUID, str]
 
 
 def generate_workout_with_intervals(
     exercises: List[Exercise], config: WorkoutConfig
-) -> List[Dict]:
+) -> List[WorkoutItem]:
     """
     Génère la liste de WorkoutExercise en alternant exercices et breaks.
 
@@ -302,7 +430,7 @@ def generate_workout_with_intervals(
         config: Configuration du workout avec les intervals work_time/rest_time
 
     Returns:
-        Liste de dictionnaires avec structure :
+        Liste de WorkoutItem (sérialisés en JSON par FastAPI comme des dicts) :
         [Exercice1, Break1, Exercice2, Break2, ...]
 
     Example:
@@ -315,37 +443,34 @@ def generate_workout_with_intervals(
     work_time = config.intervals.get("work_time", 40)
     rest_time = config.intervals.get("rest_time", 20)
 
-    workout_items = []
-    order = 0
+    workout_items: List[WorkoutItem] = []
 
     for idx, exercise in enumerate(exercises):
         # Ajouter l'exercice
         workout_items.append(
-            {
-                "name": exercise.name,
-                "description": exercise.description or f"Exercice {exercise.name}",
-                "icon": getattr(exercise, "icon", "🏋️"),
-                "duration": work_time,
-                "order": order,
-                "is_break": False,
-                "exercise_id": exercise.id,
-            }
+            WorkoutItem(
+                name=exercise.name,
+                description=exercise.description or f"Exercice {exercise.name}",
+                icon=getattr(exercise, "icon", "🏋️"),
+                duration=work_time,
+                order=2 * idx,
+                is_break=False,
+                exercise_id=exercise.id,
+            )
         )
-        order += 1
 
         # Ajouter un break (sauf après le dernier exercice)
         if idx < len(exercises) - 1:
             workout_items.append(
-                {
-                    "name": "Break",
-                    "description": "Période de récupération",
-                    "icon": "⏸️",
-                    "duration": rest_time,
-                    "order": order,
-                    "is_break": True,
-                    "exercise_id": "break",
-                }
+                WorkoutItem(
+                    name="Break",
+                    description="Période de récupération",
+                    icon="⏸️",
+                    duration=rest_time,
+                    order=2 * idx + 1,
+                    is_break=True,
+                    exercise_id="break",
+                )
             )
-            order += 1
 
     return workout_items
@@ -1,5 +1,29 @@
 import os
 import sys
 
+import pytest
+
 # Ajouter le répertoire parent au path pour permettre l'import des modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+@pytest.fixture
+def make_h264_clip(tmp_path):
+    """Fabrique de vraies vidéos H.264 (encodées via PyAV, ignoré si absent)."""
+    av = pytest.importorskip("av")
+
+    def make(name="clip.mp4", width=64, height=48, fps=30, seconds=1):
+        path = tmp_path / name
+        with av.open(str(path), "w") as container:
+            stream = container.add_stream("libx264", rate=fps)
+            stream.width = width
+            stream.height = height
+            stream.pix_fmt = "yuv420p"
+            frame = av.VideoFrame(width, height, "yuv420p")
+            for index in range(fps * seconds):
+                frame.pts = index
+                container.mux(stream.encode(frame))
+            container.mux(stream.encode(None))
+        return path
+
+    return make
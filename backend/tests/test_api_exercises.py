@@ -1,8 +1,11 @@
 """Tests pour l'API des exercices."""
 
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api import exercises as exercises_api
 from app.main import app
 from app.models.exercise import Exercise
 
@@ -192,5 +195,42 @@ class TestCORS:
         assert "access-control-allow-origin" in response.headers
 
 
+class TestLoadExercisesCache:
+    """Tests pour le cache mémoire de load_exercises"""
+
+    def test_load_exercises_cached_until_ttl(self):
+        """Vérifie qu'un seul chargement Supabase a lieu pendant le TTL"""
+        exercises = [
+            Exercise(
+                name="Push-ups",
+                video_url="push_ups.mov",
+                default_duration=30,
+                difficulty="easy",
+            )
+        ]
+
+        with (
+            patch.dict(
+                exercises_api._exercises_cache, {"loaded_at": 0.0, "data": None}
+            ),
+            patch.object(exercises_api, "USE_SUPABASE", True),
+            patch.object(
+                exercises_api, "load_exercises_from_supabase", return_value=exercises
+            ) as mock_load,
+        ):
+            first = exercises_api.load_exercises()
+            second = exercises_api.load_exercises()
+            assert mock_load.call_count == 1
+
+            exercises_api._exercises_cache["loaded_at"] -= (
+                exercises_api.EXERCISES_CACHE_TTL
+            )
+            exercises_api.load_exercises()
+
+        assert first == second == exercises
+        assert first is not second
+        assert mock_load.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
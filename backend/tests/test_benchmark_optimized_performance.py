@@ -0,0 +1,89 @@
+"""Tests unitaires du benchmark comparatif (sans FFmpeg ni scénario réel)."""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+import benchmark_optimized_performance as bench
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def make_benchmark(tmp_path):
+    """Fabrique de benchmarks sans exercices, sorties dans tmp_path."""
+
+    def make(verbose: bool = True) -> bench.OptimizedPerformanceBenchmark:
+        with (
+            patch.object(bench, "load_exercises_from_json", return_value=[]),
+            patch.object(bench.tempfile, "gettempdir", return_value=str(tmp_path)),
+        ):
+            return bench.OptimizedPerformanceBenchmark(verbose=verbose)
+
+    return make
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def orjson_available(request):
+    """Exécute le test avec et sans orjson (ignoré si orjson est absent)."""
+    if request.param:
+        pytest.importorskip("orjson")
+    with patch.object(bench, "ORJSON_AVAILABLE", request.param):
+        yield request.param
+
+
+# ============================================================================
+# TESTS: save_report
+# ============================================================================
+
+
+def test_save_report_writes_same_json(make_benchmark, orjson_available, tmp_path):
+    """Vérifie le rapport écrit (identique avec ou sans orjson) et atomique."""
+    benchmark = make_benchmark(verbose=False)
+    report_path = tmp_path / "report.json"
+    when = datetime(2026, 1, 2, 3, 4, 5)
+
+    benchmark.save_report({"scénario": "Quick", "when": when}, report_path)
+    benchmark.cleanup()
+
+    assert json.loads(report_path.read_bytes()) == {
+        "scénario": "Quick",
+        "when": str(when),
+    }
+    assert [p.name for p in tmp_path.glob("report.json*")] == ["report.json"]
+
+
+# ============================================================================
+# TESTS: log (mode silencieux)
+# ============================================================================
+
+
+def test_quiet_log_writes_json_lines(make_benchmark, orjson_available):
+    """Vérifie les logs JSON lines du mode silencieux (avec ou sans orjson)."""
+    benchmark = make_benchmark(verbose=False)
+
+    benchmark.log("Scénario terminé", "WARN")
+    benchmark.cleanup()
+
+    log_file = benchmark.output_dir / f"bench_{benchmark._run_id}.log.jsonl"
+    entries = [json.loads(line) for line in log_file.read_bytes().splitlines()]
+    assert entries[0]["lvl"] == "WARN"
+    assert entries[0]["msg"] == "Scénario terminé"
+    assert isinstance(entries[0]["ts"], float)
+    assert "Scénario terminé" in log_file.read_text(encoding="utf-8")
+    assert benchmark._log_fp is None
+
+
+def test_verbose_log_prints_without_file(make_benchmark, capsys):
+    """Vérifie qu'en mode verbose les logs restent sur le terminal."""
+    benchmark = make_benchmark(verbose=True)
+
+    benchmark.log("Scénario terminé", "SUCCESS")
+
+    assert "Scénario terminé" in capsys.readouterr().out
+    assert not list(benchmark.output_dir.glob("*.log.jsonl"))
@@ -0,0 +1,433 @@
+"""Tests unitaires pour le service vidéo (sans appel réel à FFmpeg)."""
+
+import fcntl
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models.config import WorkoutConfig
+from app.models.exercise import Difficulty, Exercise
+from app.services.video_service import (
+    PIPE_BUFFER_SIZE,
+    VideoService,
+    _enlarge_pipe,
+    _ffmpeg_encoder_cache,
+    _get_disk_cache,
+    _probe_cached,
+    _probe_with_pyav,
+    _split_cpus,
+)
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def video_service(tmp_path):
+    """Fixture fournissant un VideoService avec un cache dans tmp_path."""
+    return VideoService(project_root=tmp_path, video_cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def local_exercises(tmp_path):
+    """Fixture fournissant deux exercices dont les vidéos existent localement."""
+    exercises = []
+    for name in ("Push-ups", "Air Squat"):
+        video = tmp_path / f"{name}.mov"
+        video.write_bytes(b"fake")
+        exercises.append(
+            Exercise(
+                name=name,
+                video_url=str(video),
+                default_duration=30,
+                difficulty=Difficulty.EASY,
+            )
+        )
+    return exercises
+
+
+@pytest.fixture(autouse=True)
+def clear_probe_cache():
+    """Vide le cache des probes et force ffprobe (sans PyAV ni cache disque)."""
+    _probe_cached.cache_clear()
+    with (
+        patch("app.services.video_service.PYAV_AVAILABLE", False),
+        patch("app.services.video_service._get_disk_cache", return_value=None),
+    ):
+        yield
+    _probe_cached.cache_clear()
+
+
+def test_sport_room_image_resolved_at_init(tmp_path):
+    """Vérifie que l'image des breaks est trouvée une fois à l'initialisation."""
+    with patch("app.services.video_service.Path.exists", autospec=True) as mock_exists:
+        mock_exists.side_effect = lambda path: path == tmp_path / "sport_room.png"
+        service = VideoService(project_root=tmp_path, video_cache_dir=tmp_path)
+
+    assert service.sport_room_image == tmp_path / "sport_room.png"
+
+
+# ============================================================================
+# TESTS: get_video_info
+# ============================================================================
+
+
+def test_get_video_info_probes_once_for_unchanged_file(video_service, tmp_path):
+    """Vérifie qu'un fichier inchangé n'est sondé qu'une seule fois."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    ffprobe_output = SimpleNamespace(stdout='{"streams": []}', returncode=0)
+
+    with patch(
+        "app.services.video_service.subprocess.run", return_value=ffprobe_output
+    ) as mock_run:
+        first = video_service.get_video_info(video)
+        second = video_service.get_video_info(video)
+
+    assert first == second == {"streams": []}
+    assert mock_run.call_count == 1
+
+
+def test_get_video_info_reprobes_modified_file(video_service, tmp_path):
+    """Vérifie qu'un fichier modifié (mtime/taille) est sondé à nouveau."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    ffprobe_output = SimpleNamespace(stdout='{"streams": []}', returncode=0)
+
+    with patch(
+        "app.services.video_service.subprocess.run", return_value=ffprobe_output
+    ) as mock_run:
+        video_service.get_video_info(video)
+        video.write_bytes(b"fake but longer")
+        os.utime(video, ns=(1, 1))
+        video_service.get_video_info(video)
+
+    assert mock_run.call_count == 2
+
+
+def test_get_video_info_reuses_disk_cache(video_service, tmp_path):
+    """Vérifie qu'un probe présent dans le cache disque n'est pas relancé."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    st = video.stat()
+    disk_cache = {("probe", str(video), st.st_mtime_ns, st.st_size): {"streams": []}}
+
+    with (
+        patch("app.services.video_service._get_disk_cache", return_value=disk_cache),
+        patch("app.services.video_service.subprocess.run") as mock_run,
+    ):
+        info = video_service.get_video_info(video)
+
+    assert info == {"streams": []}
+    mock_run.assert_not_called()
+
+
+def test_get_disk_cache_opens_diskcache(tmp_path):
+    """Vérifie l'ouverture du vrai cache diskcache dans PROBE_CACHE_DIR."""
+    diskcache = pytest.importorskip("diskcache")
+    _get_disk_cache.cache_clear()
+    try:
+        with patch(
+            "app.services.video_service.PROBE_CACHE_DIR", str(tmp_path / "probes")
+        ):
+            cache = _get_disk_cache()
+        assert isinstance(cache, diskcache.Cache)
+        assert cache.directory == str(tmp_path / "probes")
+        cache.close()
+    finally:
+        _get_disk_cache.cache_clear()
+
+
+def test_get_video_info_shared_between_processes_via_diskcache(video_service, tmp_path):
+    """Vérifie qu'un probe écrit dans diskcache sert à un autre processus."""
+    diskcache = pytest.importorskip("diskcache")
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    ffprobe_output = SimpleNamespace(stdout='{"streams": []}', returncode=0)
+
+    with (
+        diskcache.Cache(str(tmp_path / "probes")) as disk_cache,
+        patch("app.services.video_service._get_disk_cache", return_value=disk_cache),
+        patch(
+            "app.services.video_service.subprocess.run", return_value=ffprobe_output
+        ) as mock_run,
+    ):
+        first = video_service.get_video_info(video)
+        # Autre worker: cache mémoire vide, même cache disque
+        _probe_cached.cache_clear()
+        second = video_service.get_video_info(video)
+
+    assert first == second == {"streams": []}
+    assert mock_run.call_count == 1
+
+
+def test_probe_with_pyav_matches_ffprobe_shape(make_h264_clip):
+    """Vérifie la lecture réelle via PyAV, au format de la sortie ffprobe."""
+    clip = make_h264_clip(width=64, height=48, fps=30, seconds=1)
+    size = clip.stat().st_size
+
+    info = _probe_with_pyav(str(clip), size)
+
+    assert info["streams"] == [
+        {
+            "codec_name": "h264",
+            "width": 64,
+            "height": 48,
+            "avg_frame_rate": "30/1",
+            "duration": "1.000000",
+        }
+    ]
+    assert info["format"]["size"] == str(size)
+    assert float(info["format"]["duration"]) == pytest.approx(1.0)
+
+
+def test_get_video_info_missing_file_returns_empty(video_service, tmp_path):
+    """Vérifie qu'un fichier inexistant retourne un dict vide."""
+    assert video_service.get_video_info(tmp_path / "missing.mp4") == {}
+
+
+def test_get_video_info_failed_probe_returns_empty(video_service, tmp_path):
+    """Vérifie qu'un code retour ffprobe non nul donne un dict vide."""
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"fake")
+    ffprobe_output = SimpleNamespace(stdout="", stderr="Invalid data", returncode=1)
+
+    with patch(
+        "app.services.video_service.subprocess.run", return_value=ffprobe_output
+    ):
+        assert video_service.get_video_info(video) == {}
+
+
+# ============================================================================
+# TESTS: build_ffmpeg_command
+# ============================================================================
+
+
+def test_build_ffmpeg_command_single_concat_input(
+    video_service, local_exercises, tmp_path
+):
+    """Vérifie que toute la séance passe par un seul input concat."""
+    (video_service.video_cache_dir / "break_20s.mp4").write_bytes(b"fake")
+    config = WorkoutConfig(intervals={"work_time": 40, "rest_time": 20})
+
+    with patch.object(video_service, "ffmpeg_path", "/usr/bin/ffmpeg"):
+        command, concat_manifest = video_service.build_ffmpeg_command(
+            local_exercises, config, tmp_path / "out.mp4"
+        )
+
+    assert command[0] == "/usr/bin/ffmpeg"
+    assert command[command.index("-loglevel") + 1] == "error"
+    assert command.count("-i") == 1
+    assert command[command.index("-f") + 1] == "concat"
+    assert command[command.index("-i") + 1] == "pipe:0"
+    assert command[-1] == str(tmp_path / "out.mp4")
+
+    assert concat_manifest.splitlines() == [
+        f"file '{tmp_path / 'Push-ups.mov'}'",
+        "outpoint 40",
+        f"file '{video_service.video_cache_dir / 'break_20s.mp4'}'",
+        f"file '{tmp_path / 'Air Squat.mov'}'",
+        "outpoint 40",
+    ]
+
+
+def test_get_break_video_renames_complete_encode(video_service):
+    """Vérifie que le break est encodé à part puis renommé, une seule fois."""
+    encoded_paths = []
+
+    def fake_generate(duration, output_path):
+        encoded_paths.append(output_path)
+        output_path.write_bytes(b"break")
+        return True
+
+    with patch.object(video_service, "generate_break_video", side_effect=fake_generate):
+        first = video_service._get_break_video(20)
+        second = video_service._get_break_video(20)
+
+    assert first == second == video_service.video_cache_dir / "break_20s.mp4"
+    assert first.read_bytes() == b"break"
+    assert len(encoded_paths) == 1
+    assert encoded_paths[0] != first
+    assert not encoded_paths[0].exists()
+
+
+def test_get_break_video_failed_encode_not_cached(video_service):
+    """Vérifie qu'un encodage partiel en échec n'est pas pris pour le cache."""
+
+    def failing_generate(duration, output_path):
+        output_path.write_bytes(b"partial")
+        return False
+
+    with patch.object(
+        video_service, "generate_break_video", side_effect=failing_generate
+    ):
+        assert video_service._get_break_video(20) is None
+
+    assert list(video_service.video_cache_dir.iterdir()) == []
+
+
+def test_build_ffmpeg_command_missing_video_returns_none(video_service, tmp_path):
+    """Vérifie qu'une vidéo introuvable fait échouer la construction."""
+    exercise = Exercise(
+        name="Ghost",
+        video_url=str(tmp_path / "ghost.mov"),
+        default_duration=30,
+        difficulty=Difficulty.EASY,
+    )
+
+    with patch.object(video_service, "ffmpeg_path", "/usr/bin/ffmpeg"):
+        command = video_service.build_ffmpeg_command(
+            [exercise], WorkoutConfig(), tmp_path / "out.mp4"
+        )
+
+    assert command is None
+
+
+def test_detect_hw_encoder_prefers_working_nvenc(tmp_path):
+    """Vérifie que NVENC est retenu s'il est compilé et fonctionnel."""
+    encoders = SimpleNamespace(
+        stdout=" V....D h264_nvenc NVIDIA NVENC\n V....D libx264 x264\n",
+        returncode=0,
+    )
+    test_encode = SimpleNamespace(stdout="", returncode=0)
+    _ffmpeg_encoder_cache.clear()
+
+    with (
+        patch("app.services.video_service.shutil.which", return_value="ffmpeg"),
+        patch(
+            "app.services.video_service.subprocess.run",
+            side_effect=[encoders, test_encode],
+        ),
+    ):
+        service = VideoService(project_root=tmp_path, video_cache_dir=tmp_path)
+
+    _ffmpeg_encoder_cache.clear()
+    assert service.video_encoder == "h264_nvenc"
+
+
+# ============================================================================
+# TESTS: generate_videos
+# ============================================================================
+
+
+def test_generate_videos_preserves_job_order(video_service, tmp_path):
+    """Vérifie que les résultats sont renvoyés dans l'ordre des jobs."""
+    jobs = [([], WorkoutConfig(), tmp_path / f"out_{i}.mp4") for i in range(4)]
+
+    with patch.object(
+        video_service,
+        "generate_workout_video",
+        side_effect=lambda exercises, config, output: output.name != "out_2.mp4",
+    ) as mock_generate:
+        results = video_service.generate_videos(jobs, max_parallel=2)
+
+    assert results == [True, True, False, True]
+    assert mock_generate.call_count == 4
+
+
+def test_generate_workout_video_streams_manifest_and_progress(
+    video_service, local_exercises, tmp_path
+):
+    """Vérifie l'envoi du manifeste sur stdin et le suivi de l'avancement."""
+    output = tmp_path / "out.mp4"
+    config = WorkoutConfig(intervals={"work_time": 40, "rest_time": 20})
+    seen_progress = []
+
+    def fake_stderr():
+        # 20s encodées sur 40s attendues (un seul exercice, pas de break)
+        yield "out_time_us=20000000\n"
+        seen_progress.append(video_service.get_progress(output))
+        yield "progress=end\n"
+        output.write_bytes(b"mp4")
+
+    process = MagicMock(returncode=0, stderr=fake_stderr())
+
+    with (
+        patch.object(video_service, "ffmpeg_path", "/usr/bin/ffmpeg"),
+        patch("app.services.video_service._enlarge_pipe"),
+        patch("app.services.video_service._deprioritize_process"),
+        patch(
+            "app.services.video_service.subprocess.Popen", return_value=process
+        ) as mock_popen,
+    ):
+        success = video_service.generate_workout_video(
+            local_exercises[:1], config, output
+        )
+
+    assert success
+    command = mock_popen.call_args.args[0]
+    assert command[command.index("-progress") + 1] == "pipe:2"
+    manifest = process.stdin.write.call_args.args[0]
+    assert manifest.startswith(f"file '{tmp_path / 'Push-ups.mov'}'")
+    process.stdin.close.assert_called_once()
+    assert seen_progress == [0.5]
+    assert video_service.get_progress(output) is None
+
+
+def test_generate_workout_video_reports_ffmpeg_error_on_broken_pipe(
+    video_service, local_exercises, tmp_path
+):
+    """Vérifie que stderr est lu et FFmpeg attendu si stdin est déjà fermé."""
+    output = tmp_path / "out.mp4"
+    process = MagicMock(returncode=1, stderr=iter(["Unknown encoder 'libx265'\n"]))
+    process.stdin.write.side_effect = BrokenPipeError
+
+    with (
+        patch.object(video_service, "ffmpeg_path", "/usr/bin/ffmpeg"),
+        patch("app.services.video_service._enlarge_pipe"),
+        patch("app.services.video_service._deprioritize_process"),
+        patch("app.services.video_service.subprocess.Popen", return_value=process),
+        patch("app.services.video_service.logger") as mock_logger,
+    ):
+        success = video_service.generate_workout_video(
+            local_exercises[:1], WorkoutConfig(), output
+        )
+
+    assert not success
+    process.wait.assert_called_once()
+    assert "Unknown encoder" in mock_logger.error.call_args.args[0]
+
+
+def test_split_cpus_returns_disjoint_groups():
+    """Vérifie que les groupes de coeurs sont disjoints et couvrent tout."""
+    with patch(
+        "app.services.video_service.os.sched_getaffinity",
+        return_value={0, 1, 2, 3, 4, 5},
+        create=True,
+    ):
+        groups = _split_cpus(2)
+        assert _split_cpus(8) == []
+
+    assert groups == [{0, 2, 4}, {1, 3, 5}]
+
+
+def test_default_max_parallel_caps_cpu_encoder(video_service):
+    """Vérifie que libx264 est limité à la moitié des coeurs."""
+    video_service.video_encoder = "libx264"
+    with patch("app.services.video_service.os.cpu_count", return_value=8):
+        assert video_service._default_max_parallel() == 4
+
+    video_service.video_encoder = "h264_nvenc"
+    assert video_service._default_max_parallel() == 2
+
+
+# ============================================================================
+# TESTS: _enlarge_pipe
+# ============================================================================
+
+
+@pytest.mark.skipif(
+    not hasattr(fcntl, "F_GETPIPE_SZ"), reason="F_SETPIPE_SZ propre à Linux"
+)
+def test_enlarge_pipe_grows_kernel_buffer():
+    """Vérifie que le buffer noyau du pipe est agrandi."""
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    with os.fdopen(write_fd, "wb") as writer:
+        _enlarge_pipe(writer)
+        size = fcntl.fcntl(writer.fileno(), fcntl.F_GETPIPE_SZ)
+
+    assert size == PIPE_BUFFER_SIZE
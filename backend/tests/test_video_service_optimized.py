@@ -0,0 +1,612 @@
+"""Tests unitaires pour le service vidéo optimisé (sans appel réel à FFmpeg)."""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.models.config import WorkoutConfig
+from app.models.exercise import Difficulty, Exercise
+from app.services.video_service_optimized import OptimizedVideoService, VideoFormat
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+@pytest.fixture
+def optimized_service(tmp_path):
+    """Fixture fournissant un OptimizedVideoService avec un cache dans tmp_path."""
+    service = OptimizedVideoService(
+        project_root=tmp_path, video_cache_dir=tmp_path / "cache"
+    )
+    service.ffmpeg_path = "/usr/bin/ffmpeg"
+    return service
+
+
+@pytest.fixture
+def target_format():
+    """Fixture fournissant un format déjà au format cible (720p H.264 30fps)."""
+    return VideoFormat(codec="h264", width=1280, height=720, fps=30.0)
+
+
+# ============================================================================
+# TESTS: build_progressive_concat
+# ============================================================================
+
+
+def test_build_progressive_concat_single_ffmpeg_call(
+    optimized_service, target_format, tmp_path
+):
+    """Vérifie que vidéos et breaks sont concaténés en un seul appel FFmpeg."""
+    videos = [tmp_path / f"video_{i}.mp4" for i in range(3)]
+    break_path = tmp_path / "break_20s.mp4"
+    output = tmp_path / "out.mp4"
+
+    def fake_run(command, **kwargs):
+        output.write_bytes(b"mp4")
+        return SimpleNamespace(returncode=0, stderr="")
+
+    with (
+        patch.object(
+            optimized_service, "detect_video_format", return_value=target_format
+        ),
+        patch(
+            "app.services.video_service_optimized.subprocess.run",
+            side_effect=fake_run,
+        ) as mock_run,
+    ):
+        success = optimized_service.build_progressive_concat(
+            videos, [break_path, break_path, None], output
+        )
+
+    assert success
+    assert mock_run.call_count == 1
+    command = mock_run.call_args.args[0]
+    assert command[command.index("-c") + 1] == "copy"
+    assert mock_run.call_args.kwargs["input"].splitlines() == [
+        f"file '{videos[0]}'",
+        f"file '{break_path}'",
+        f"file '{videos[1]}'",
+        f"file '{break_path}'",
+        f"file '{videos[2]}'",
+    ]
+
+
+def test_build_progressive_concat_reencodes_heterogeneous_formats(
+    optimized_service, target_format, tmp_path
+):
+    """Vérifie le ré-encodage quand les formats diffèrent du format cible."""
+    videos = [tmp_path / "a.mov", tmp_path / "b.mov"]
+    other_format = VideoFormat(codec="hevc", width=1920, height=1080, fps=30.0)
+
+    with (
+        patch.object(
+            optimized_service,
+            "detect_video_format",
+            side_effect=lambda path: (
+                target_format if path == videos[0] else other_format
+            ),
+        ),
+        patch(
+            "app.services.video_service_optimized.subprocess.run",
+            return_value=SimpleNamespace(returncode=1, stderr="boom"),
+        ) as mock_run,
+    ):
+        success = optimized_service.build_progressive_concat(
+            videos, [None, None], tmp_path / "out.mp4"
+        )
+
+    assert not success
+    command = mock_run.call_args.args[0]
+    assert "copy" not in command
+    assert command[command.index("-c:v") + 1] == "libx264"
+
+
+def test_build_progressive_concat_normalizes_only_nonconforming(
+    optimized_service, target_format, tmp_path
+):
+    """Vérifie que seules les vidéos hors format cible sont normalisées."""
+    videos = [tmp_path / "a.mp4", tmp_path / "b.mov", tmp_path / "c.mp4"]
+    other_format = VideoFormat(codec="hevc", width=1920, height=1080, fps=30.0)
+    output = tmp_path / "out.mp4"
+    for video in videos:
+        video.write_bytes(b"fake")
+
+    def fake_run(command, **kwargs):
+        output.write_bytes(b"mp4")
+        return SimpleNamespace(returncode=0, stderr="")
+
+    with (
+        patch.object(
+            optimized_service,
+            "_probe_video_format",
+            side_effect=lambda path: (
+                other_format if path == videos[1] else target_format
+            ),
+        ),
+        patch.object(
+            optimized_service,
+            "_normalize_and_cache_exercise_video",
+            side_effect=lambda path: path.with_suffix(".norm.mp4"),
+        ) as mock_normalize,
+        patch(
+            "app.services.video_service_optimized.subprocess.run",
+            side_effect=fake_run,
+        ) as mock_run,
+    ):
+        success = optimized_service.build_progressive_concat(
+            videos, [None, None, None], output
+        )
+
+    assert success
+    mock_normalize.assert_called_once_with(videos[1])
+    command = mock_run.call_args.args[0]
+    assert command[command.index("-c") + 1] == "copy"
+    assert mock_run.call_args.kwargs["input"].splitlines() == [
+        f"file '{videos[0]}'",
+        f"file '{tmp_path / 'b.norm.mp4'}'",
+        f"file '{videos[2]}'",
+    ]
+
+
+def test_video_format_requires_yuv420p():
+    """Vérifie qu'un pix_fmt connu autre que yuv420p sort du format cible."""
+    assert VideoFormat("h264", 1280, 720, 30.0, pix_fmt="yuv420p").is_target_format
+    assert not VideoFormat("h264", 1280, 720, 30.0, pix_fmt="yuv444p").is_target_format
+
+
+def test_detect_video_format_prefers_pyav(optimized_service, target_format, tmp_path):
+    """Vérifie que PyAV est utilisé sans lancer ffprobe quand il est installé."""
+    video = tmp_path / "a.mp4"
+    video.write_bytes(b"fake")
+
+    with (
+        patch("app.services.video_service.PYAV_AVAILABLE", True),
+        patch.object(
+            optimized_service, "_detect_format_pyav", return_value=target_format
+        ),
+        patch("app.services.video_service_optimized.subprocess.run") as mock_run,
+    ):
+        video_format = optimized_service.detect_video_format(video)
+
+    assert video_format == target_format
+    mock_run.assert_not_called()
+
+
+def test_detect_format_pyav_reads_real_video(optimized_service, make_h264_clip):
+    """Vérifie la détection réelle du format via PyAV sur une vidéo H.264."""
+    target_clip = make_h264_clip("target.mp4", width=1280, height=720, fps=30)
+    small_clip = make_h264_clip("small.mp4", width=64, height=48, fps=25)
+
+    target = optimized_service._detect_format_pyav(target_clip)
+    small = optimized_service._detect_format_pyav(small_clip)
+
+    assert (target.codec, target.width, target.height) == ("h264", 1280, 720)
+    assert target.fps == 30.0 and target.pix_fmt == "yuv420p"
+    assert target.is_target_format
+    assert (small.width, small.height, small.fps) == (64, 48, 25.0)
+    assert not small.is_target_format
+
+
+def test_detect_video_format_cached_across_instances(
+    optimized_service, target_format, tmp_path
+):
+    """Vérifie qu'un fichier inchangé n'est analysé qu'une fois, même après redémarrage."""
+    video = tmp_path / "a.mp4"
+    video.write_bytes(b"fake")
+
+    with patch.object(
+        optimized_service, "_probe_video_format", return_value=target_format
+    ) as mock_probe:
+        optimized_service.detect_video_format(video)
+        optimized_service.detect_video_format(video)
+    assert mock_probe.call_count == 1
+
+    restarted = OptimizedVideoService(
+        project_root=tmp_path, video_cache_dir=tmp_path / "cache"
+    )
+    with patch.object(restarted, "_probe_video_format") as mock_probe:
+        assert restarted.detect_video_format(video) == target_format
+    mock_probe.assert_not_called()
+
+
+# ============================================================================
+# TESTS: _normalize_and_cache_exercise_video
+# ============================================================================
+
+
+def test_normalize_and_cache_reuses_normalized_copy(optimized_service, tmp_path):
+    """Vérifie qu'une vidéo hors format n'est normalisée qu'une seule fois."""
+    video = tmp_path / "a.mov"
+    video.write_bytes(b"fake")
+    other_format = VideoFormat(codec="hevc", width=1920, height=1080, fps=30.0)
+
+    def fake_normalize(input_path, output_path, threads=None):
+        output_path.write_bytes(b"normalized")
+        return True
+
+    with (
+        patch.object(
+            optimized_service, "detect_video_format", return_value=other_format
+        ),
+        patch.object(
+            optimized_service, "_normalize_video", side_effect=fake_normalize
+        ) as mock_normalize,
+    ):
+        first = optimized_service._normalize_and_cache_exercise_video(video)
+        second = optimized_service._normalize_and_cache_exercise_video(video)
+
+    assert first == second
+    assert first.parent == optimized_service.normalized_dir
+    assert first.read_bytes() == b"normalized"
+    assert mock_normalize.call_count == 1
+
+
+def test_normalize_and_cache_invalidated_by_target_format_change(
+    optimized_service, tmp_path
+):
+    """Vérifie qu'un changement de TARGET_FORMAT force une nouvelle normalisation."""
+    video = tmp_path / "a.mov"
+    video.write_bytes(b"fake")
+
+    def fake_normalize(input_path, output_path, threads=0):
+        output_path.write_bytes(b"normalized")
+        return True
+
+    with (
+        patch.object(optimized_service, "detect_video_format", return_value=None),
+        patch.object(
+            optimized_service, "_normalize_video", side_effect=fake_normalize
+        ) as mock_normalize,
+    ):
+        first = optimized_service._normalize_and_cache_exercise_video(video)
+        optimized_service.TARGET_FORMAT = {
+            **OptimizedVideoService.TARGET_FORMAT,
+            "crf": 28,
+        }
+        second = optimized_service._normalize_and_cache_exercise_video(video)
+
+    assert first != second
+    assert mock_normalize.call_count == 2
+
+
+def test_normalize_all_preserves_order(optimized_service, tmp_path):
+    """Vérifie que les vidéos normalisées sont renvoyées dans l'ordre."""
+    videos = [tmp_path / f"video_{i}.mov" for i in range(5)]
+
+    with patch.object(
+        optimized_service,
+        "_normalize_and_cache_exercise_video",
+        side_effect=lambda path: path.with_suffix(".mp4"),
+    ):
+        normalized = optimized_service._normalize_all(videos)
+
+    assert normalized == [video.with_suffix(".mp4") for video in videos]
+
+
+def test_normalize_and_cache_keeps_target_format_source(
+    optimized_service, target_format, tmp_path
+):
+    """Vérifie qu'une vidéo déjà au format cible est utilisée telle quelle."""
+    video = tmp_path / "a.mp4"
+
+    with (
+        patch.object(
+            optimized_service, "detect_video_format", return_value=target_format
+        ),
+        patch.object(optimized_service, "_normalize_video") as mock_normalize,
+    ):
+        assert optimized_service._normalize_and_cache_exercise_video(video) == video
+
+    mock_normalize.assert_not_called()
+
+
+def test_detect_formats_batch_probes_each_file_once(
+    optimized_service, target_format, tmp_path
+):
+    """Vérifie qu'un fichier répété n'est sondé qu'une fois et l'ordre conservé."""
+    push_ups = tmp_path / "push_ups.mp4"
+    squat = tmp_path / "squat.mp4"
+    push_ups.write_bytes(b"fake")
+    squat.write_bytes(b"fake")
+
+    with (
+        patch.object(
+            optimized_service,
+            "_probe_video_format",
+            side_effect=lambda path: target_format if path == push_ups else None,
+        ) as mock_probe,
+        patch.object(
+            optimized_service,
+            "_save_format_cache",
+            wraps=optimized_service._save_format_cache,
+        ) as mock_save,
+    ):
+        formats = optimized_service._detect_formats_batch([push_ups, squat, push_ups])
+
+    assert formats == [target_format, None, target_format]
+    assert mock_probe.call_count == 2
+    mock_save.assert_called_once()
+    cache_dir = optimized_service.format_cache_file.parent
+    assert [p.name for p in cache_dir.glob(".format_cache.json*")] == [
+        ".format_cache.json"
+    ]
+
+
+# ============================================================================
+# TESTS: generate_break_video
+# ============================================================================
+
+
+def fake_ffmpeg_run(command, **kwargs):
+    """Simule FFmpeg en créant le fichier de sortie (dernier argument)."""
+    Path(command[-1]).write_bytes(b"mp4")
+    return SimpleNamespace(returncode=0, stderr="")
+
+
+def test_generate_break_video_encodes_unit_with_pyav(optimized_service, tmp_path):
+    """Vérifie que la seconde de break est encodée en process avec PyAV."""
+    optimized_service.sport_room_image = tmp_path / "sport_room.png"
+    output = tmp_path / "break_20s.mp4"
+
+    def fake_pyav(image_path, duration, output_path):
+        output_path.write_bytes(b"mp4")
+
+    with (
+        patch("app.services.video_service.PYAV_AVAILABLE", True),
+        patch.object(
+            optimized_service, "_generate_break_pyav", side_effect=fake_pyav
+        ) as mock_pyav,
+        patch(
+            "app.services.video_service_optimized.subprocess.run",
+            side_effect=fake_ffmpeg_run,
+        ) as mock_run,
+    ):
+        assert optimized_service.generate_break_video(20, output)
+
+    assert mock_pyav.call_args.args[:2] == (tmp_path / "sport_room.png", 1)
+    # Seule la répétition en stream copy passe par FFmpeg
+    command = mock_run.call_args.args[0]
+    assert command[command.index("-c") + 1] == "copy"
+
+
+def test_encode_break_unit_with_real_pyav(optimized_service, tmp_path):
+    """Vérifie l'encodage réel d'une seconde de break via PyAV, sans FFmpeg."""
+    av = pytest.importorskip("av")
+    image = tmp_path / "sport_room.png"
+    with av.open(str(image), "w", format="image2") as container:
+        stream = container.add_stream("png")
+        stream.width, stream.height, stream.pix_fmt = 320, 240, "rgb24"
+        container.mux(stream.encode(av.VideoFrame(320, 240, "rgb24")))
+        container.mux(stream.encode(None))
+    optimized_service.video_encoder = "libx264"
+    output = tmp_path / "break_unit.mp4"
+
+    with (
+        patch("app.services.video_service.PYAV_AVAILABLE", True),
+        patch("app.services.video_service_optimized.subprocess.run") as mock_run,
+    ):
+        assert optimized_service._encode_break_unit(image, output)
+
+    mock_run.assert_not_called()
+    video_format = optimized_service._detect_format_pyav(output)
+    assert video_format.is_target_format
+    with av.open(str(output)) as container:
+        assert sum(1 for _ in container.decode(video=0)) == 30
+
+
+def test_generate_break_video_ffmpeg_tuned_for_still_image(optimized_service, tmp_path):
+    """Vérifie les options x264 d'image fixe sur le chemin FFmpeg."""
+    optimized_service.sport_room_image = tmp_path / "sport_room.png"
+    optimized_service.video_encoder = "libx264"
+
+    with (
+        patch("app.services.video_service.PYAV_AVAILABLE", False),
+        patch(
+            "app.services.video_service_optimized.subprocess.run",
+            side_effect=fake_ffmpeg_run,
+        ) as mock_run,
+    ):
+        optimized_service.generate_break_video(20, tmp_path / "break_20s.mp4")
+
+    command = mock_run.call_args_list[0].args[0]
+    assert command[command.index("-tune") + 1] == "stillimage"
+    assert command[command.index("-g") + 1] == "30"
+    assert command[command.index("-threads") + 1] == "0"
+
+
+def test_generate_break_video_loops_cached_unit(optimized_service, tmp_path):
+    """Vérifie qu'une seule seconde est encodée puis répétée sans ré-encodage."""
+    optimized_service.sport_room_image = tmp_path / "sport_room.png"
+
+    with (
+        patch("app.services.video_service.PYAV_AVAILABLE", False),
+        patch(
+            "app.services.video_service_optimized.subprocess.run",
+            side_effect=fake_ffmpeg_run,
+        ) as mock_run,
+    ):
+        assert optimized_service.generate_break_video(20, tmp_path / "break_20s.mp4")
+        assert optimized_service.generate_break_video(40, tmp_path / "break_40s.mp4")
+
+    commands = [call.args[0] for call in mock_run.call_args_list]
+    # Encodage de l'unité une seule fois, puis une boucle par durée
+    assert len(commands) == 3
+    assert commands[0][commands[0].index("-t") + 1] == "1"
+    for command, duration in ((commands[1], "20"), (commands[2], "40")):
+        assert command[command.index("-stream_loop") + 1] == str(int(duration) - 1)
+        assert command[command.index("-c") + 1] == "copy"
+        assert command[command.index("-t") + 1] == duration
+
+
+# ============================================================================
+# TESTS: encodeur cible
+# ============================================================================
+
+
+def test_normalize_video_uses_nvenc_with_nvdec(optimized_service, tmp_path):
+    """Vérifie l'encodage NVENC et le décodage NVDEC quand le GPU est détecté."""
+    optimized_service.video_encoder = "h264_nvenc"
+
+    with patch("app.services.video_service_optimized.subprocess.run") as mock_run:
+        optimized_service._normalize_video(tmp_path / "in.mov", tmp_path / "out.mp4")
+
+    command = mock_run.call_args.args[0]
+    assert command.index("-hwaccel") < command.index("-i")
+    assert command[command.index("-c:v") + 1] == "h264_nvenc"
+    assert "-crf" not in command
+
+
+# ============================================================================
+# TESTS: generate_workout_video_progressive
+# ============================================================================
+
+
+def make_exercises(tmp_path, names):
+    """Crée des exercices dont les vidéos existent dans tmp_path."""
+    exercises = []
+    for name in names:
+        video = tmp_path / f"{name}.mp4"
+        video.write_bytes(b"fake")
+        exercises.append(
+            Exercise(
+                name=name,
+                video_url=str(video),
+                default_duration=30,
+                difficulty=Difficulty.EASY,
+            )
+        )
+    return exercises
+
+
+def test_download_and_normalize_all_keeps_exercise_order(optimized_service, tmp_path):
+    """Vérifie l'ordre des résultats et qu'une vidéo manquante donne None."""
+    exercises = make_exercises(tmp_path, ("Push-ups", "Air Squat", "Lunges"))
+    (tmp_path / "Air Squat.mp4").unlink()
+
+    with patch.object(
+        optimized_service,
+        "_normalize_and_cache_exercise_video",
+        side_effect=lambda path: path.with_suffix(".norm.mp4"),
+    ) as mock_normalize:
+        normalized = optimized_service._download_and_normalize_all(exercises)
+
+    assert normalized == [
+        tmp_path / "Push-ups.norm.mp4",
+        None,
+        tmp_path / "Lunges.norm.mp4",
+    ]
+    assert mock_normalize.call_count == 2
+
+
+def test_progressive_fetches_break_once(optimized_service, tmp_path):
+    """Vérifie qu'un seul break est préparé et réutilisé entre les exercices."""
+    exercises = make_exercises(tmp_path, ("Push-ups", "Air Squat", "Lunges"))
+    videos = [tmp_path / f"{exercise.name}.mp4" for exercise in exercises]
+    break_path = tmp_path / "break_20s.mp4"
+
+    with (
+        patch.object(
+            optimized_service, "_download_and_normalize_all", return_value=videos
+        ),
+        patch.object(
+            optimized_service, "_get_or_create_break", return_value=break_path
+        ) as mock_break,
+        patch.object(
+            optimized_service,
+            "_normalize_and_cache_exercise_video",
+            side_effect=lambda p: p,
+        ),
+        patch.object(
+            optimized_service, "build_progressive_concat", return_value=False
+        ) as mock_concat,
+    ):
+        optimized_service.generate_workout_video_progressive(
+            exercises, WorkoutConfig(), tmp_path / "out.mp4"
+        )
+
+    assert mock_break.call_count == 1
+    assert mock_concat.call_args.args[1] == [break_path, break_path, None]
+
+
+# ============================================================================
+# TESTS: cleanup_cache / get_cache_stats
+# ============================================================================
+
+
+def test_cleanup_cache_removes_only_old_exercise_videos(optimized_service):
+    """Vérifie que seuls les vieux fichiers hors breaks sont supprimés."""
+    cache_dir = optimized_service.video_cache_dir
+    old_video = cache_dir / "abcd1234_push-ups.mov"
+    old_break = cache_dir / "abcd1234_break_20s.mov"
+    fresh_video = cache_dir / "abcd1234_air_squat.mov"
+    for path in (old_video, old_break, fresh_video):
+        path.write_bytes(b"fake")
+    for path in (old_video, old_break):
+        os.utime(path, (1, 1))
+
+    assert optimized_service.cleanup_cache(max_age_hours=1) == 1
+    assert not old_video.exists()
+    assert old_break.exists() and fresh_video.exists()
+
+
+def test_cleanup_cache_covers_normalized_dir(optimized_service):
+    """Vérifie que les vieilles copies normalisées sont comptées et supprimées."""
+    old_normalized = optimized_service.normalized_dir / "abcd1234.mp4"
+    old_normalized.write_bytes(b"12345678")
+    os.utime(old_normalized, (1, 1))
+
+    assert optimized_service.get_cache_stats()["video_cache"]["count"] == 1
+    assert optimized_service.cleanup_cache(max_age_hours=1) == 1
+    assert not old_normalized.exists()
+
+
+def test_cleanup_cache_expires_stale_break_units(optimized_service):
+    """Vérifie que seules les secondes de break des réglages courants restent."""
+    cache_dir = optimized_service.video_cache_dir
+    current_unit = cache_dir / optimized_service._break_unit_name()
+    stale_unit = cache_dir / "break_unit_h264_nvenc_0123456789ab.mp4"
+    for path in (current_unit, stale_unit):
+        path.write_bytes(b"fake")
+    os.utime(current_unit, (1, 1))
+
+    assert optimized_service.cleanup_cache(max_age_hours=1) == 1
+    assert current_unit.exists()
+    assert not stale_unit.exists()
+
+
+def test_get_cache_stats_separates_breaks(optimized_service):
+    """Vérifie le décompte des vidéos et des breaks du cache."""
+    cache_dir = optimized_service.video_cache_dir
+    (cache_dir / "abcd1234_push-ups.mov").write_bytes(b"12345678")
+    (cache_dir / "abcd1234_break_20s.mov").write_bytes(b"1234")
+
+    stats = optimized_service.get_cache_stats()
+
+    assert stats["video_cache"]["count"] == 1
+    assert stats["break_cache"]["count"] == 1
+    assert stats["break_cache"]["size_mb"] == 4 / (1024 * 1024)
+
+
+def test_cleanup_and_stats_single_scan(optimized_service):
+    """Vérifie que nettoyage et statistiques partagent un seul parcours."""
+    cache_dir = optimized_service.video_cache_dir
+    old_video = cache_dir / "abcd1234_push-ups.mov"
+    old_video.write_bytes(b"fake")
+    os.utime(old_video, (1, 1))
+    (cache_dir / "abcd1234_break_20s.mov").write_bytes(b"1234")
+
+    with patch(
+        "app.services.video_service_optimized.os.scandir", wraps=os.scandir
+    ) as mock_scandir:
+        deleted, stats = optimized_service.cleanup_and_stats(max_age_hours=1)
+
+    # Un seul parcours de chaque dossier (cache et normalized)
+    assert mock_scandir.call_count == 2
+    assert deleted == 1
+    assert stats["video_cache"]["count"] == 0
+    assert stats["break_cache"]["count"] == 1
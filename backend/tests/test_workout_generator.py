@@ -1,5 +1,9 @@
 """Tests unitaires pour le service de génération d'exercices."""
 
+import json
+import os
+from dataclasses import asdict
+
 import pytest
 from uuid import uuid4
 from pathlib import Path
@@ -13,6 +17,7 @@ from app.services.workout_generator import (
     filter_exercises,
     generate_random_exercises,
     generate_workout_exercises,
+    generate_workout_with_intervals,
 )
 
 
@@ -109,6 +114,72 @@ def test_load_exercises_from_json_success():
     assert all(ex.id is not None for ex in exercises)
 
 
+def test_load_exercises_from_json_cached_until_modified(tmp_path):
+    """Vérifie que le JSON n'est relu que si le fichier a été modifié."""
+    exercises_file = tmp_path / "exercises.json"
+    exercise = {
+        "name": "Push-ups",
+        "video_url": "push_ups.mov",
+        "default_duration": 30,
+        "difficulty": "easy",
+    }
+    exercises_file.write_text(json.dumps([exercise]))
+
+    with (
+        patch("app.services.workout_generator.EXERCISES_FILE", exercises_file),
+        patch("app.services.workout_generator.ORJSON_AVAILABLE", False),
+        patch(
+            "app.services.workout_generator.json.loads", wraps=json.loads
+        ) as mock_load,
+    ):
+        first = load_exercises_from_json()
+        second = load_exercises_from_json()
+        assert mock_load.call_count == 1
+        assert first == second
+        assert first is not second
+
+        exercises_file.write_text(json.dumps([{**exercise, "name": "Air Squat"}]))
+        os.utime(exercises_file, ns=(1, 1))
+        reloaded = load_exercises_from_json()
+
+    assert mock_load.call_count == 2
+    assert [ex.name for ex in reloaded] == ["Air Squat"]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_exercises_from_json_decoders_agree(tmp_path, use_orjson):
+    """Vérifie que orjson et json produisent les mêmes exercices."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    exercises_file = tmp_path / "exercises.json"
+    exercises_file.write_text(
+        json.dumps(
+            [
+                {
+                    "name": "Épaules",
+                    "video_url": "epaules.mov",
+                    "default_duration": 30,
+                    "difficulty": "medium",
+                    "has_jump": True,
+                }
+            ]
+        )
+    )
+
+    with (
+        patch("app.services.workout_generator.EXERCISES_FILE", exercises_file),
+        patch("app.services.workout_generator.ORJSON_AVAILABLE", use_orjson),
+        patch(
+            "app.services.workout_generator.json.loads", wraps=json.loads
+        ) as mock_json_loads,
+    ):
+        exercises = load_exercises_from_json()
+
+    assert mock_json_loads.called is not use_orjson
+    assert [(ex.name, ex.has_jump) for ex in exercises] == [("Épaules", True)]
+    assert exercises[0].difficulty == "medium"
+
+
 def test_load_exercises_json_not_found():
     """Vérifie l'erreur si le fichier exercises.json n'existe pas."""
     with patch(
@@ -164,6 +235,16 @@ def test_filter_with_jump_allowed(sample_exercises):
     assert len(filtered) == 5
 
 
+def test_filter_without_criteria_returns_copy(sample_exercises):
+    """Vérifie qu'en l'absence de filtre tout le pool est renvoyé (copie)."""
+    filtered = filter_exercises(
+        exercises=sample_exercises, no_jump=False, intensity_levels=[]
+    )
+
+    assert filtered == sample_exercises
+    assert filtered is not sample_exercises
+
+
 def test_filter_difficulty_levels(sample_exercises):
     """Vérifie le filtrage par niveau de difficulté."""
     filtered = filter_exercises(
@@ -238,6 +319,18 @@ def test_generate_random_exercises_with_replacement(sample_exercises):
     assert len(exercise_names) > len(set(exercise_names))
 
 
+def test_generate_random_exercises_avoids_two_previous(sample_exercises):
+    """Vérifie qu'aucun exercice ne reprend l'un des 2 précédents."""
+    pool = sample_exercises[:3]
+
+    for _ in range(20):
+        selected = generate_random_exercises(pool, count=30)
+        for i in range(1, len(selected)):
+            assert selected[i].id != selected[i - 1].id
+            if i >= 2:
+                assert selected[i].id != selected[i - 2].id
+
+
 def test_generate_random_exercises_zero_count(sample_exercises):
     """Vérifie le comportement avec count=0."""
     selected = generate_random_exercises(sample_exercises, count=0)
@@ -420,6 +513,39 @@ def test_generate_workout_exercises_custom_duration_is_none():
         assert all(ex.custom_duration is None for ex in result)
 
 
+def test_generate_workout_exercises_reuses_filtered_pool(sample_workout):
+    """Vérifie que le filtrage n'est refait qu'au changement de liste source."""
+    source = [
+        Exercise(
+            id=uuid4(),
+            name="Push-ups",
+            video_url="/path/to/video.mov",
+            default_duration=30,
+            difficulty=Difficulty.EASY,
+            has_jump=False,
+        )
+    ]
+
+    with (
+        patch(
+            "app.api.exercises.get_cached_exercises", return_value=source
+        ) as mock_cached,
+        patch(
+            "app.services.workout_generator.filter_exercises",
+            side_effect=filter_exercises,
+        ) as mock_filter,
+    ):
+        generate_workout_exercises(sample_workout)
+        generate_workout_exercises(sample_workout)
+        assert mock_filter.call_count == 1
+
+        # Rechargement du cache : nouvelle liste source
+        mock_cached.return_value = list(source)
+        generate_workout_exercises(sample_workout)
+
+    assert mock_filter.call_count == 2
+
+
 # ============================================================================
 # TESTS D'INTÉGRATION
 # ============================================================================
@@ -483,3 +609,30 @@ def test_full_workflow_all_exercises_allowed():
     assert all(isinstance(ex, WorkoutExercise) for ex in result)
     assert result[0].order_index == 0
     assert result[-1].order_index == 19
+
+
+# ============================================================================
+# TESTS DE generate_workout_with_intervals()
+# ============================================================================
+
+
+def test_generate_workout_with_intervals_alternates_breaks(sample_exercises):
+    """Vérifie l'alternance exercice/break et l'ordre séquentiel."""
+    config = WorkoutConfig(intervals={"work_time": 40, "rest_time": 20})
+
+    items = generate_workout_with_intervals(sample_exercises[:3], config)
+
+    assert [item.order for item in items] == [0, 1, 2, 3, 4]
+    assert [item.is_break for item in items] == [False, True, False, True, False]
+    assert asdict(items[1]) == {
+        "name": "Break",
+        "description": "Période de récupération",
+        "icon": "⏸️",
+        "duration": 20,
+        "order": 1,
+        "is_break": True,
+        "exercise_id": "break",
+    }
+    assert items[2].exercise_id == sample_exercises[1].id
+    assert items[2].duration == 40
+    assert generate_workout_with_intervals([], config) == []